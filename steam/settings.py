@@ -156,9 +156,27 @@ STATIC_URL = 'static/'
 
 MEDIA_URL = 'steam/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# Absolute url MEDIA_URL is publicly served at, staged uploads are handed out to clients with it
+MEDIA_PUBLIC_URL = config("MEDIA_PUBLIC_URL", f"http://localhost:8000/{MEDIA_URL}")
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+PAGINATION_DEFAULT_PAGE_SIZE = config("PAGINATION_DEFAULT_PAGE_SIZE", 20, cast=int)
+PAGINATION_MAX_PAGE_SIZE = config("PAGINATION_MAX_PAGE_SIZE", 100, cast=int)
+
+WEB_AUTH_CACHE_SIZE = config("WEB_AUTH_CACHE_SIZE", 1024, cast=int)
+WEB_AUTH_CACHE_TTL = config("WEB_AUTH_CACHE_TTL", 60, cast=int)
+
+APP_AUTH_CACHE_SIZE = config("APP_AUTH_CACHE_SIZE", 4096, cast=int)
+APP_AUTH_CACHE_TTL = config("APP_AUTH_CACHE_TTL", 60, cast=int)
+
+ZALO_CONNECT_TIMEOUT = config("ZALO_CONNECT_TIMEOUT", 3.05, cast=float)
+ZALO_READ_TIMEOUT = config("ZALO_READ_TIMEOUT", 10, cast=float)
+ZALO_MAX_RETRIES = config("ZALO_MAX_RETRIES", 2, cast=int)
+ZALO_POOL_SIZE = config("ZALO_POOL_SIZE", 10, cast=int)
+ZALO_PROFILE_CACHE_SIZE = config("ZALO_PROFILE_CACHE_SIZE", 1024, cast=int)
+ZALO_PROFILE_CACHE_TTL = config("ZALO_PROFILE_CACHE_TTL", 300, cast=int)
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=180),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
@@ -239,3 +257,20 @@ AUTH_USER_MODEL = 'steam_api.WebUser'
 
 GDRIVE_SERVICE_ACCOUNT_FILE = config("GDRIVE_SERVICE_ACCOUNT_FILE")
 GDRIVE_DEFAULT_FOLDER_ID = config("GDRIVE_DEFAULT_FOLDER_ID", "")
+GDRIVE_HTTP_TIMEOUT = config("GDRIVE_HTTP_TIMEOUT", 60, cast=int)
+
+UPLOAD_WORKERS = config("UPLOAD_WORKERS", 4, cast=int)
+UPLOAD_MAX_RETRIES = config("UPLOAD_MAX_RETRIES", 3, cast=int)
+UPLOAD_RETRY_BACKOFF = config("UPLOAD_RETRY_BACKOFF", 2, cast=float)
+
+IMAGE_FORMAT = config("IMAGE_FORMAT", "WEBP")
+IMAGE_QUALITY = config("IMAGE_QUALITY", 80, cast=int)
+IMAGE_MAX_DIMENSION = config("IMAGE_MAX_DIMENSION", 1920, cast=int)
+IMAGE_VARIANTS = {
+    "small": config("IMAGE_SMALL_DIMENSION", 320, cast=int),
+    "medium": config("IMAGE_MEDIUM_DIMENSION", 800, cast=int),
+}
+
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", 3600, cast=int)
+
+EXPORT_CHUNK_SIZE = config("EXPORT_CHUNK_SIZE", 2000, cast=int)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class SteamApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'steam_api'
+
+    def ready(self):
+        from steam_api import signals  # noqa: F401
@@ -0,0 +1,2 @@
+class ClassRoomFullException(Exception): 
+    pass
@@ -0,0 +1,79 @@
+from typing import Callable, Dict, List, Optional
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+def upsert_lesson_rows(
+    model,
+    lesson,
+    items: Dict[int, dict],
+    fields: List[str],
+    update_live: bool = True,
+    prepare: Optional[Callable] = None
+) -> List[models.Model]:
+    """
+    Writes one row of the model per student of the lesson (items are keyed by
+    student id) in one transaction: new rows are inserted with bulk_create and
+    existing ones updated with bulk_update. Live rows only get the fields present
+    in their item, soft-deleted rows (which still hold the unique lesson/student
+    pair) are revived like new ones. With update_live=False a live row is a
+    conflict and raises IntegrityError. prepare(row, now) runs on every row
+    before writing, in place of the model save() the bulk writes bypass.
+
+    A concurrent insert of one of the pairs makes bulk_create fail, the upsert is
+    then retried once and sees the committed row.
+
+    Returns the rows with their student, sharing the already loaded lesson.
+    """
+    try:
+        _upsert(model, lesson, items, fields, update_live, prepare)
+    except IntegrityError:
+        _upsert(model, lesson, items, fields, update_live, prepare)
+
+    rows = list(model.objects.filter(lesson=lesson, student_id__in=items.keys()).select_related('student'))
+
+    # Share the already loaded lesson instead of fetching it again for every row
+    for row in rows:
+        row.lesson = lesson
+
+    return rows
+
+def _upsert(model, lesson, items: Dict[int, dict], fields: List[str], update_live: bool, prepare: Optional[Callable]):
+    now = timezone.now()
+
+    with transaction.atomic():
+        existing = {
+            row.student_id: row
+            for row in model.objects.select_for_update().filter(lesson=lesson, student_id__in=items.keys())
+        }
+
+        to_create = []
+        to_update = []
+        for student_id, item in items.items():
+            row = existing.get(student_id)
+
+            if row is None:
+                row = model(lesson=lesson, student_id=student_id)
+                to_create.append(row)
+            elif row.deleted_at is None:
+                if not update_live:
+                    raise IntegrityError(f"{model.__name__} of student {student_id} already exists")
+
+                row.updated_at = now
+                to_update.append(row)
+            else:
+                for field in fields:
+                    setattr(row, field, model._meta.get_field(field).get_default())
+
+                row.deleted_at = None
+                row.updated_at = now
+                to_update.append(row)
+
+            for field in fields:
+                if field in item:
+                    setattr(row, field, item[field])
+
+            if prepare is not None:
+                prepare(row, now)
+
+        model.objects.bulk_create(to_create)
+        model.objects.bulk_update(to_update, [*fields, 'deleted_at', 'updated_at'])
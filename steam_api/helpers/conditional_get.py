@@ -0,0 +1,84 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional
+from django.db.models import Aggregate, Count, Max
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+def _weak(etag: str) -> str:
+    return etag[2:] if etag.startswith('W/') else etag
+
+class ResponseValidators(NamedTuple):
+    """
+    ETag and Last-Modified of a response, computed from the rows it is serialized
+    from so that unchanged resources can be answered with a 304 before serializing.
+    """
+    etag: str
+    last_modified: Optional[str]
+
+    @classmethod
+    def for_queryset(cls, request, queryset, related: Iterable[str] = (), extra: Dict[str, Aggregate] = None) -> "ResponseValidators":
+        """
+        One aggregate query over the queryset: the row count (which catches removals)
+        and the latest updated_at of the rows and of the related rows the serializer
+        nests. Soft deleted related rows are not filtered out on purpose, deleting
+        them bumps their updated_at. extra holds additional aggregates the payload
+        depends on, e.g. LessonOccurrence.status_aggregates for time based fields.
+
+        Last-Modified cannot see rows leaving the queryset, clients should prefer
+        If-None-Match (which wins when both are sent).
+        """
+        aggregates = {
+            'count': Count('pk', distinct=True),
+            'updated_at': Max('updated_at'),
+        }
+
+        for path in related:
+            aggregates[f'{path}__count'] = Count(path, distinct=True)
+            aggregates[f'{path}__updated_at'] = Max(f'{path}__updated_at')
+
+        aggregates.update(extra or {})
+
+        values = queryset.order_by().aggregate(**aggregates)
+        latest = max((value for value in values.values() if isinstance(value, datetime)), default=None)
+
+        digest = hashlib.md5(
+            f"{request.get_full_path()}:{request.user.pk}:{sorted(values.items())}".encode()
+        ).hexdigest()
+
+        return cls(
+            etag=f'W/"{digest}"',
+            last_modified=http_date(latest.timestamp()) if latest else None
+        )
+
+    @classmethod
+    def from_headers(cls, headers) -> Optional["ResponseValidators"]:
+        if not headers.get('ETag'):
+            return None
+
+        return cls(etag=headers['ETag'], last_modified=headers.get('Last-Modified'))
+
+    def matches(self, request) -> bool:
+        """
+        Whether the client copy is still fresh (RFC 9110 section 13.2.2): If-None-Match
+        is evaluated with the weak comparison, If-Modified-Since only without it.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return False
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return '*' in etags or _weak(self.etag) in {_weak(etag) for etag in etags}
+
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE') or '')
+        last_modified = parse_http_date_safe(self.last_modified or '')
+
+        return bool(if_modified_since and last_modified and last_modified <= if_modified_since)
+
+    def apply(self, response):
+        response['ETag'] = self.etag
+
+        if self.last_modified:
+            response['Last-Modified'] = self.last_modified
+
+        return response
@@ -0,0 +1,108 @@
+from typing import Dict, List
+from django.db.models import Avg, Count, F, FloatField, Func, Max, Min, Window
+from django.db.models.expressions import RowRange
+from steam_api.const.score_criteria import SCORE_CRITERIA
+
+CRITERIA_CODES = [criteria["code"] for criteria in SCORE_CRITERIA]
+
+# Grouping field and the name fields returned with it
+GROUP_BY_FIELDS = {
+    "student": ("student_id", ["student__first_name", "student__last_name"]),
+    "module": ("lesson__module_id", ["lesson__module__name"]),
+    "class_room": ("lesson__module__class_room_id", ["lesson__module__class_room__name"]),
+}
+
+class _MovingAvg(Func):
+    """
+    AVG usable over an aggregate inside a window (Django's Avg refuses aggregates),
+    i.e. AVG(AVG(score)) OVER (...) on a grouped query.
+    """
+    function = "AVG"
+    window_compatible = True
+    output_field = FloatField()
+
+def _round(value):
+    return round(float(value), 2) if value is not None else None
+
+def _criteria_aggregates() -> Dict:
+    aggregates = {}
+
+    for code in CRITERIA_CODES:
+        aggregates[f"{code}__avg"] = Avg(code)
+        aggregates[f"{code}__min"] = Min(code)
+        aggregates[f"{code}__max"] = Max(code)
+
+    return aggregates
+
+def _criteria(row: Dict) -> Dict:
+    return {
+        code: {
+            "avg": _round(row[f"{code}__avg"]),
+            "min": row[f"{code}__min"],
+            "max": row[f"{code}__max"],
+        }
+        for code in CRITERIA_CODES
+    }
+
+def summarize(queryset) -> Dict:
+    row = queryset.order_by().aggregate(count=Count("id"), **_criteria_aggregates())
+    return {"count": row["count"], "criteria": _criteria(row)}
+
+def summarize_by(queryset, group_by: str) -> List[Dict]:
+    field, name_fields = GROUP_BY_FIELDS[group_by]
+    rows = queryset.values(field, *name_fields).annotate(count=Count("id"), **_criteria_aggregates()).order_by(field)
+
+    return [
+        {
+            group_by: row[field],
+            "name": " ".join(str(row[name_field]) for name_field in name_fields if row[name_field]),
+            "count": row["count"],
+            "criteria": _criteria(row),
+        }
+        for row in rows
+    ]
+
+def trend(queryset, window: int) -> List[Dict]:
+    """
+    Per lesson averages of every criterion with their moving average over the last
+    `window` lessons of the class, in lesson order. Filtered on a student, it is
+    that student's progression.
+    """
+    order_by = [F("lesson__module__sequence_number").asc(), F("lesson__sequence_number").asc()]
+    averages = {f"{code}__avg": Avg(code) for code in CRITERIA_CODES}
+    moving_averages = {
+        f"{code}__moving_avg": Window(
+            _MovingAvg(Avg(code)),
+            partition_by=[F("lesson__module__class_room_id")],
+            order_by=order_by,
+            frame=RowRange(start=-(window - 1), end=0)
+        )
+        for code in CRITERIA_CODES
+    }
+
+    rows = queryset.values(
+        "lesson__module__class_room_id",
+        "lesson__module_id",
+        "lesson__module__sequence_number",
+        "lesson_id",
+        "lesson__name",
+        "lesson__sequence_number",
+    ).annotate(count=Count("id"), **averages).annotate(**moving_averages).order_by("lesson__module__class_room_id", *order_by)
+
+    return [
+        {
+            "class_room": row["lesson__module__class_room_id"],
+            "module": row["lesson__module_id"],
+            "lesson": row["lesson_id"],
+            "lesson_name": row["lesson__name"],
+            "count": row["count"],
+            "criteria": {
+                code: {
+                    "avg": _round(row[f"{code}__avg"]),
+                    "moving_avg": _round(row[f"{code}__moving_avg"]),
+                }
+                for code in CRITERIA_CODES
+            },
+        }
+        for row in rows
+    ]
@@ -1,18 +1,66 @@
 import io
+import json
 import mimetypes
+import threading
+import httplib2
 from datetime import datetime
 from django.conf import settings
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.http import MediaIoBaseUpload
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
+
+# Files up to this size are sent in a single multipart request instead of a resumable session
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+_credentials = None
+_discovery_document = None
+_lock = threading.Lock()
+_local = threading.local()
+
+def get_drive_credentials():
+    global _credentials
+
+    if _credentials is None:
+        with _lock:
+            if _credentials is None:
+                scopes = ["https://www.googleapis.com/auth/drive.file"]
+                _credentials = service_account.Credentials.from_service_account_file(
+                    str(settings.GDRIVE_SERVICE_ACCOUNT_FILE),
+                    scopes=scopes
+                )
+
+    return _credentials
+
+def get_drive_discovery_document() -> dict:
+    global _discovery_document
+
+    if _discovery_document is None:
+        with _lock:
+            if _discovery_document is None:
+                _discovery_document = json.loads(get_static_doc("drive", "v3"))
+
+    return _discovery_document
 
 def get_drive_service():
-    scopes = ["https://www.googleapis.com/auth/drive.file"]
-    creds = service_account.Credentials.from_service_account_file(
-        str(settings.GDRIVE_SERVICE_ACCOUNT_FILE),
-        scopes=scopes
-    )
-    return build("drive", "v3", credentials=creds)
+    """
+    Returns the Drive service of the current thread. httplib2 connections are not
+    thread-safe, so every thread keeps its own keep-alive connection while the
+    credentials (refreshed on demand by AuthorizedHttp) and the parsed discovery
+    document are shared by the whole process.
+    """
+    service = getattr(_local, "service", None)
+
+    if service is None:
+        http = AuthorizedHttp(
+            get_drive_credentials(),
+            http=httplib2.Http(timeout=settings.GDRIVE_HTTP_TIMEOUT)
+        )
+        service = build_from_document(get_drive_discovery_document(), http=http)
+        _local.service = service
+
+    return service
 
 def upload_image_to_drive(file, folder_id=None, make_public=True):
     service = get_drive_service()
@@ -31,7 +79,8 @@ def upload_image_to_drive(file, folder_id=None, make_public=True):
     if hasattr(file, "seek"):
         file.seek(0)
 
-    media = MediaIoBaseUpload(file, mimetype=mime, resumable=True)
+    size = getattr(file, "size", None)
+    media = MediaIoBaseUpload(file, mimetype=mime, resumable=size is None or size > RESUMABLE_UPLOAD_THRESHOLD)
     created = service.files().create(
         body=metadata,
         media_body=media,
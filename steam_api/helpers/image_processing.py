@@ -0,0 +1,102 @@
+import io
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageCms, ImageOps, UnidentifiedImageError
+
+@dataclass(frozen=True)
+class ProcessedImage:
+    file: ContentFile
+    variants: Dict[str, ContentFile] = field(default_factory=dict)
+
+def _encode(image: Image.Image, name: str, icc_profile: Optional[bytes]) -> ContentFile:
+    image_format = settings.IMAGE_FORMAT.upper()
+    buffer = io.BytesIO()
+
+    if image_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # EXIF (GPS position, camera, ...) is dropped by re-encoding without it
+    options = {"quality": settings.IMAGE_QUALITY}
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    if image_format == "JPEG":
+        options["optimize"] = True
+        options["progressive"] = True
+    elif image_format == "WEBP":
+        options["method"] = 4
+
+    image.save(buffer, format=image_format, **options)
+    extension = "jpg" if image_format == "JPEG" else image_format.lower()
+
+    return ContentFile(buffer.getvalue(), name=f"{name}.{extension}")
+
+def _to_srgb(image: Image.Image, icc_profile: Optional[bytes]) -> Image.Image:
+    """
+    Converts a non RGB image (CMYK, grayscale, ...) to RGB through its embedded ICC
+    profile to sRGB, falling back to a plain conversion without a usable profile.
+    """
+    if icc_profile:
+        try:
+            source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+            return ImageCms.profileToProfile(image, source, ImageCms.createProfile("sRGB"), outputMode="RGB")
+        except (ImageCms.PyCMSError, OSError) as e:
+            logging.getLogger().warning("process_image cannot apply icc_profile mode=%s, exc=%s", image.mode, e)
+
+    return image.convert("RGB")
+
+def _resize(image: Image.Image, max_dimension: int) -> Image.Image:
+    if max(image.size) <= max_dimension:
+        return image
+
+    resized = image.copy()
+    resized.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    return resized
+
+def process_image(file) -> Optional[ProcessedImage]:
+    """
+    Normalizes an uploaded image before it is stored: applies the EXIF orientation,
+    strips metadata, downscales it to IMAGE_MAX_DIMENSION and re-encodes it as
+    IMAGE_FORMAT, along with one smaller copy per IMAGE_VARIANTS entry.
+
+    Returns None when the file is not an image Pillow can read, the caller should
+    then keep the original file.
+    """
+    name = os.path.splitext(os.path.basename(getattr(file, "name", "") or "upload"))[0]
+
+    try:
+        if hasattr(file, "seek"):
+            file.seek(0)
+
+        with Image.open(file) as opened:
+            icc_profile = opened.info.get("icc_profile")
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except (UnidentifiedImageError, OSError) as e:
+        logging.getLogger().warning("process_image cannot read name=%s, exc=%s", name, e)
+        return None
+    finally:
+        if hasattr(file, "seek"):
+            file.seek(0)
+
+    if image.mode not in ("RGB", "RGBA"):
+        if "transparency" in image.info or image.mode in ("LA", "PA"):
+            image = image.convert("RGBA")
+        else:
+            image = _to_srgb(image, icc_profile)
+
+        # The source profile describes the old mode, the converted pixels are sRGB
+        icc_profile = None
+
+    image = _resize(image, settings.IMAGE_MAX_DIMENSION)
+
+    return ProcessedImage(
+        file=_encode(image, name, icc_profile),
+        variants={
+            variant: _encode(_resize(image, max_dimension), f"{name}_{variant}", icc_profile)
+            for variant, max_dimension in settings.IMAGE_VARIANTS.items()
+        }
+    )
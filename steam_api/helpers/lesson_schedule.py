@@ -1,127 +1,111 @@
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from django.utils import timezone
 from zoneinfo import ZoneInfo
 
-def get_lesson_date(start_date: datetime.date, schedule: Dict[str, str], lesson_sequence: int) -> Optional[datetime.date]:
-    day_mapping = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-    
-    class_days = []
-    for day in schedule.keys():
-        day = day.lower()
-        if day in day_mapping:
-            class_days.append(day_mapping[day])
-    class_days.sort()
-    
-    if not class_days:
+DAY_MAPPING = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+@dataclass(frozen=True)
+class CompiledSchedule:
+    """
+    A class schedule parsed once into the day offsets (from the class start date)
+    of its first week, so that a lesson sequence maps to its date by plain arithmetic.
+    """
+    start_date: datetime.date
+    offsets: Tuple[int, ...]
+    times: Tuple[Optional[Tuple[time, time]], ...]
+
+    @property
+    def lessons_per_week(self) -> int:
+        return len(self.offsets)
+
+    def get_lesson_date(self, lesson_sequence: int) -> Optional[datetime.date]:
+        if not self.offsets:
+            return None
+
+        weeks, index = divmod(lesson_sequence - 1, self.lessons_per_week)
+        return self.start_date + timedelta(days=7 * weeks + self.offsets[index])
+
+    def get_lesson_times(self, lesson_sequence: int) -> Optional[Tuple[time, time]]:
+        if not self.offsets:
+            return None
+
+        return self.times[(lesson_sequence - 1) % self.lessons_per_week]
+
+    def get_lesson_start_datetime(self, lesson_sequence: int) -> Optional[datetime]:
+        lesson_date = self.get_lesson_date(lesson_sequence)
+        lesson_times = self.get_lesson_times(lesson_sequence)
+
+        if not lesson_date or not lesson_times:
+            return None
+
+        return datetime.combine(lesson_date, lesson_times[0], tzinfo=ZoneInfo('Asia/Ho_Chi_Minh'))
+
+    def get_lesson_end_datetime(self, lesson_sequence: int) -> Optional[datetime]:
+        lesson_date = self.get_lesson_date(lesson_sequence)
+        lesson_times = self.get_lesson_times(lesson_sequence)
+
+        if not lesson_date or not lesson_times:
+            return None
+
+        return datetime.combine(lesson_date, lesson_times[1], tzinfo=ZoneInfo('Asia/Ho_Chi_Minh'))
+
+def _parse_time_range(time_range: Optional[str]) -> Optional[Tuple[time, time]]:
+    if not time_range:
         return None
-        
-    total_days_needed = lesson_sequence - 1
-    weeks = total_days_needed // len(class_days)
-    remaining_days = total_days_needed % len(class_days)
-    
-    current_date = start_date
-    
-    current_date += timedelta(weeks=weeks)
-    
+
+    start_time, end_time = time_range.split('-')
+    return datetime.strptime(start_time, '%H:%M').time(), datetime.strptime(end_time, '%H:%M').time()
+
+@lru_cache(maxsize=1024)
+def _compile_schedule(start_date: datetime.date, schedule_items: Tuple[Tuple[str, str], ...]) -> CompiledSchedule:
+    schedule = dict(schedule_items)
     start_weekday = start_date.weekday()
-    first_class_day = None
-    for day in class_days:
-        if day >= start_weekday:
-            first_class_day = day
-            break
-    if first_class_day is None:
-        first_class_day = class_days[0]
-        current_date += timedelta(days=7-start_weekday+first_class_day)
-    else:
-        current_date += timedelta(days=first_class_day-start_weekday)
-    
-    if remaining_days > 0:
-        days_to_add = 0
-        current_weekday = current_date.weekday()
-        days_added = 0
-        
-        while days_added < remaining_days:
-            next_day_index = (class_days.index(current_weekday) + 1) % len(class_days)
-            next_day = class_days[next_day_index]
-            
-            if next_day <= current_weekday:
-                days_to_add += 7 - current_weekday + next_day
-            else:
-                days_to_add += next_day - current_weekday
-                
-            current_weekday = next_day
-            days_added += 1
-            
-        current_date += timedelta(days=days_to_add)
-    
-    return current_date
-
-def calculate_lesson_status(
+
+    days = []
+    for day in schedule.keys():
+        day = day.lower()
+        if day in DAY_MAPPING:
+            days.append(((DAY_MAPPING[day] - start_weekday) % 7, day))
+    days = sorted(set(days))
+
+    return CompiledSchedule(
+        start_date=start_date,
+        offsets=tuple(offset for offset, _ in days),
+        times=tuple(_parse_time_range(schedule.get(day)) for _, day in days)
+    )
+
+def compile_schedule(start_date: datetime.date, schedule: Dict[str, str]) -> CompiledSchedule:
+    return _compile_schedule(start_date, tuple(sorted((schedule or {}).items())))
+
+def calculate_occurrence_status(
     start_date: datetime.date,
     end_date: datetime.date,
-    schedule: Dict[str, str],
-    lesson_sequence: int
+    start_datetime: Optional[datetime],
+    end_datetime: Optional[datetime]
 ) -> str:
     vn_tz = ZoneInfo('Asia/Ho_Chi_Minh')
     now = timezone.localtime(timezone.now(), vn_tz)
     today = now.date()
-    
+
+    if not start_datetime or not end_datetime:
+        return 'not_started'
+
     if today < start_date:
         return 'not_started'
-        
+
     if today > end_date:
         return 'completed'
-    
-    lesson_date = get_lesson_date(start_date, schedule, lesson_sequence)
-    if not lesson_date:
-        return 'not_started'
-        
-    if lesson_date > today:
+
+    if now < start_datetime:
         return 'not_started'
-    
-    if lesson_date == today:
-        weekday = lesson_date.strftime('%A').lower()
-        time_range = schedule.get(weekday)
-        if time_range:
-            start_time = datetime.strptime(time_range.split('-')[0], '%H:%M').time()
-            end_time = datetime.strptime(time_range.split('-')[1], '%H:%M').time()
-            current_time = now.time()
-            
-            if current_time < start_time:
-                return 'not_started'
-            elif current_time > end_time:
-                return 'completed'
-            else:
-                return 'in_progress'
-    
-    return 'completed'
-
-def get_lesson_start_datetime(start_date: datetime.date, schedule: Dict[str, str], lesson_sequence: int) -> datetime:
-    lesson_date = get_lesson_date(start_date, schedule, lesson_sequence)
-
-    if not lesson_date:
-        return None
-    
-    start_time = schedule.get(lesson_date.strftime('%A').lower())   
-    
-    if not start_time:
-        return None
-    
-    return datetime.combine(lesson_date, datetime.strptime(start_time.split('-')[0], '%H:%M').time(), tzinfo=ZoneInfo('Asia/Ho_Chi_Minh'))
 
-def get_lesson_end_datetime(start_date: datetime.date, schedule: Dict[str, str], lesson_sequence: int) -> datetime:
-    lesson_date = get_lesson_date(start_date, schedule, lesson_sequence)
+    if now > end_datetime:
+        return 'completed'
 
-    if not lesson_date:
-        return None
-    
-    end_time = schedule.get(lesson_date.strftime('%A').lower())
-    
-    if not end_time:
-        return None
-    
-    return datetime.combine(lesson_date, datetime.strptime(end_time.split('-')[1], '%H:%M').time(), tzinfo=ZoneInfo('Asia/Ho_Chi_Minh'))
\ No newline at end of file
+    return 'in_progress'
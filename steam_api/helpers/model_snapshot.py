@@ -0,0 +1,14 @@
+from typing import Type
+from django.db import models
+
+def take_snapshot(instance: models.Model) -> dict:
+    """
+    Returns the concrete field values of a model instance, keyed by attname.
+    """
+    return {field.attname: getattr(instance, field.attname) for field in instance._meta.concrete_fields}
+
+def restore_snapshot(model: Type[models.Model], snapshot: dict) -> models.Model:
+    """
+    Rebuilds an instance from take_snapshot() output as if it was loaded from the database.
+    """
+    return model.from_db(None, list(snapshot.keys()), list(snapshot.values()))
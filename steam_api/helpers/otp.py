@@ -3,15 +3,17 @@ import random
 from enum import Enum
 from django.core.cache import cache
 
+from steam_api.helpers.session_registry import register_key, remove_group
+
 class OTPPurpose(Enum):
     Session = "session"
 
 def generate_otp(length: int, purpose: OTPPurpose, email: str) -> str:
     try:
-        cache.delete_many(cache.keys(f"{purpose}:account:{email}:otp:*"))
+        remove_group(f"{purpose}:account:{email}:otp")
 
         otp = str(random.randint(10**length, 10**(length + 1) - 1))
-        cache.set(f"{purpose}:account:{email}:otp:{otp}", email, 3600)
+        register_key(f"{purpose}:account:{email}:otp", f"{purpose}:account:{email}:otp:{otp}", email, 3600)
 
         return otp
     except Exception as e:
@@ -0,0 +1,240 @@
+import base64
+import json
+from datetime import date, datetime, time
+from functools import wraps
+from typing import List, Optional
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q, QuerySet
+from rest_framework import status
+from rest_framework.request import Request
+from drf_yasg import openapi
+
+from steam_api.errors.invalid_cursor_exception import InvalidCursorException
+from steam_api.helpers.response import RestResponse
+
+PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        'cursor',
+        openapi.IN_QUERY,
+        description='Cursor returned as pagination.next_cursor by the previous page',
+        type=openapi.TYPE_STRING,
+        required=False
+    ),
+    openapi.Parameter(
+        'page_size',
+        openapi.IN_QUERY,
+        description='Number of items per page (enables pagination)',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    )
+]
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # Keep full microsecond precision, DjangoJSONEncoder truncates to milliseconds
+        if isinstance(o, (datetime, date, time)):
+            return o.isoformat()
+
+        return super().default(o)
+
+class KeysetPaginator():
+    """
+    Opt-in keyset (cursor) pagination for list endpoints.
+
+    Pagination is only applied when the request carries `cursor` or `page_size`,
+    otherwise the queryset is returned untouched. The cursor encodes the ordering
+    values of the last returned row, so the next page is fetched with a plain
+    indexed comparison instead of an OFFSET scan.
+    """
+    def __init__(self, request: Request, model, ordering: List[str]) -> None:
+        self.__cursor = request.query_params.get('cursor')
+        self.__page_size = request.query_params.get('page_size')
+        self.__ordering = list(ordering)
+        self.__next_cursor = None
+        self.__page_size_value = None
+
+        if not any(field.lstrip('-') in ('id', 'pk') for field in self.__ordering):
+            self.__ordering.append('-id' if self.__ordering and self.__ordering[0].startswith('-') else 'id')
+
+        self.__fields = [self.__resolve_field(model, field.lstrip('-')) for field in self.__ordering]
+        self.__cursor_values = self.__decode_cursor(self.__cursor) if self.__cursor else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.__cursor is not None or self.__page_size is not None
+
+    @property
+    def pagination(self) -> Optional[dict]:
+        if not self.enabled:
+            return None
+
+        return {
+            "next_cursor": self.__next_cursor,
+            "page_size": self.__page_size_value,
+            "has_next": self.__next_cursor is not None,
+        }
+
+    def paginate(self, queryset: QuerySet):
+        if not self.enabled:
+            return queryset
+
+        page_size = self.__get_page_size()
+        queryset = queryset.order_by(*self.__get_order_by())
+
+        if self.__cursor_values is not None:
+            queryset = queryset.filter(self.__get_cursor_filter(self.__cursor_values))
+
+        rows = list(queryset[:page_size + 1])
+        self.__page_size_value = page_size
+
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.__next_cursor = self.__encode_cursor([self.__get_value(rows[-1], field) for field in self.__ordering])
+
+        return rows
+
+    def __get_page_size(self) -> int:
+        default_page_size = settings.PAGINATION_DEFAULT_PAGE_SIZE
+        max_page_size = settings.PAGINATION_MAX_PAGE_SIZE
+
+        if self.__page_size is None:
+            return default_page_size
+
+        try:
+            page_size = int(self.__page_size)
+        except ValueError:
+            return default_page_size
+
+        return max(1, min(page_size, max_page_size))
+
+    def __get_order_by(self) -> list:
+        order_by = []
+
+        # NULLs sort as the smallest value (MySQL's order), whatever the database
+        for field, (_, nullable) in zip(self.__ordering, self.__fields):
+            if not nullable:
+                order_by.append(field)
+            elif field.startswith('-'):
+                order_by.append(F(field[1:]).desc(nulls_last=True))
+            else:
+                order_by.append(F(field).asc(nulls_first=True))
+
+        return order_by
+
+    def __get_cursor_filter(self, values: list) -> Q:
+        fields = [field.lstrip('-') for field in self.__ordering]
+        cursor_filter = Q()
+
+        for index, field in enumerate(self.__ordering):
+            value = values[index]
+
+            if field.startswith('-'):
+                # Nothing sorts after NULL in descending order
+                if value is None:
+                    continue
+
+                condition = Q(**{f'{fields[index]}__lt': value})
+                if self.__fields[index][1]:
+                    condition |= Q(**{f'{fields[index]}__isnull': True})
+            elif value is None:
+                condition = Q(**{f'{fields[index]}__isnull': False})
+            else:
+                condition = Q(**{f'{fields[index]}__gt': value})
+
+            for previous in range(index):
+                if values[previous] is None:
+                    condition &= Q(**{f'{fields[previous]}__isnull': True})
+                else:
+                    condition &= Q(**{fields[previous]: values[previous]})
+
+            cursor_filter |= condition
+
+        return cursor_filter
+
+    def __get_value(self, obj, field: str):
+        value = obj
+        for attr in field.lstrip('-').split('__'):
+            value = getattr(value, 'pk' if attr == 'pk' else attr)
+
+            if value is None:
+                break
+
+        return getattr(value, 'pk', value)
+
+    def __encode_cursor(self, values: list) -> str:
+        return base64.urlsafe_b64encode(json.dumps(values, cls=CursorEncoder).encode()).decode()
+
+    def __resolve_field(self, model, path: str) -> tuple:
+        """
+        Model field at the end of an ordering path and whether the path can be NULL.
+        """
+        nullable = False
+
+        for attr in path.split('__'):
+            field = model._meta.pk if attr == 'pk' else model._meta.get_field(attr)
+            nullable = nullable or field.null
+
+            if field.is_relation:
+                model = field.related_model
+
+        # A relation orders by the key it points at
+        if field.is_relation:
+            field = field.target_field
+
+        return field, nullable
+
+    def __decode_cursor(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, UnicodeError):
+            raise InvalidCursorException("Invalid cursor!")
+
+        if not isinstance(values, list) or len(values) != len(self.__ordering):
+            raise InvalidCursorException("Invalid cursor!")
+
+        decoded = []
+        for value, (field, nullable) in zip(values, self.__fields):
+            if value is None:
+                if not nullable:
+                    raise InvalidCursorException("Invalid cursor!")
+
+                decoded.append(None)
+                continue
+
+            # Cursors come from the client, a value of the wrong type would fail in the query
+            if isinstance(value, (list, dict)):
+                raise InvalidCursorException("Invalid cursor!")
+
+            try:
+                value = field.to_python(value)
+            except (ValidationError, TypeError, ValueError):
+                raise InvalidCursorException("Invalid cursor!")
+
+            if value is None:
+                raise InvalidCursorException("Invalid cursor!")
+
+            decoded.append(value)
+
+        return decoded
+
+def keyset_paginated(model, ordering: List[str]):
+    """
+    Builds the KeysetPaginator of a list view method over the given model and passes
+    it as the paginator keyword argument. Invalid cursors are answered with a 400
+    before the view runs.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            try:
+                paginator = KeysetPaginator(request, model, ordering=ordering)
+            except InvalidCursorException:
+                return RestResponse(message="Cursor không hợp lệ!", status=status.HTTP_400_BAD_REQUEST).response
+
+            return func(self, request, *args, paginator=paginator, **kwargs)
+
+        return wrapper
+
+    return decorator
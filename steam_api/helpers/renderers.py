@@ -0,0 +1,75 @@
+import logging
+import re
+from functools import lru_cache
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numbers orjson writes differently from json.dumps (1e16 vs 1e+16, 0.00001 vs 1e-05).
+# May also match inside strings, which only costs a fallback to JSONRenderer. The
+# cheaper exponent/leading zeros scans go first, the full pattern is slow on big payloads.
+_DIVERGENT_NUMBER = re.compile(rb'(?<![^:\[,])-?(?:\d+(?:\.\d+)?e-?\d+|0\.0000\d+)(?![^,\]}])')
+_EXPONENT = re.compile(rb'e(?<=\de)-?\d')
+
+def _may_diverge(ret: bytes) -> bool:
+    return (b'0.0000' in ret or _EXPONENT.search(ret) is not None) and _DIVERGENT_NUMBER.search(ret) is not None
+
+_default = encoders.JSONEncoder().default
+
+def _dumps(value) -> bytes:
+    # Dates and dataclasses go through the DRF encoder like in JSONRenderer
+    return orjson.dumps(value, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+@lru_cache(maxsize=256)
+def _envelope_fields(code: str, message: str) -> bytes:
+    return b',"code":' + _dumps(code) + b',"message":' + _dumps(message)
+
+def _is_envelope(data) -> bool:
+    keys = list(data) if type(data) is dict else []
+
+    return (
+        keys[:3] == ["data", "code", "message"]
+        and keys[3:] in ([], ["pagination"])
+        and type(data["code"]) is str
+        and type(data["message"]) is str
+    )
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same bytes with orjson. The RestResponse envelope
+    is assembled from pre-encoded code/message fragments around the encoded data.
+    Falls back to JSONRenderer for indented output, for numbers orjson formats
+    differently and for anything orjson refuses (e.g. integers over 64 bits), or
+    when orjson is not installed. Non-finite floats render as null instead of
+    failing.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if orjson is None or self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            if _is_envelope(data):
+                ret = b'{"data":' + _dumps(data["data"]) + _envelope_fields(data["code"], data["message"])
+
+                if "pagination" in data:
+                    ret += b',"pagination":' + _dumps(data["pagination"])
+
+                ret += b'}'
+            else:
+                ret = _dumps(data)
+        except orjson.JSONEncodeError as e:
+            logging.getLogger().info("FastJSONRenderer.render fallback exc=%s", e)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if _may_diverge(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same strict javascript subset escaping as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,25 +1,43 @@
+from rest_framework import status
 from rest_framework.response import Response
+from steam_api.helpers.conditional_get import ResponseValidators
 
 class RestResponse():
     content_type = "application/json"
 
-    def __init__(self, data: dict = None, code: str = "", message: str = "", status: int = 200) -> None:
+    def __init__(self, data: dict = None, code: str = "", message: str = "", status: int = 200, pagination: dict = None, validators: ResponseValidators = None) -> None:
         self.__data = data
         self.__message = message
         self.__code = code
         self.__status = status
+        self.__pagination = pagination
+        self.__validators = validators
     
     @property
     def response(self):
-        return Response(
-            {
-                "data": self.__data,
-                "code": self.__code,
-                "message": self.__get_default_message(),
-            },
+        body = {
+            "data": self.__data,
+            "code": self.__code,
+            "message": self.__get_default_message(),
+        }
+
+        if self.__pagination is not None:
+            body["pagination"] = self.__pagination
+
+        response = Response(
+            body,
             status=self.__status,
             content_type=self.content_type
         )
+
+        if self.__validators is not None:
+            self.__validators.apply(response)
+
+        return response
+
+    @staticmethod
+    def not_modified(validators: ResponseValidators) -> Response:
+        return validators.apply(Response(status=status.HTTP_304_NOT_MODIFIED))
     
     def __get_default_message(self):
         return self.__message or {
@@ -0,0 +1,105 @@
+import hashlib
+import logging
+from functools import wraps
+from typing import Dict, Iterable
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.response import RestResponse
+
+def _version_key(namespace: str) -> str:
+    return f"response_cache:{namespace}:version"
+
+def _counter_key(namespace: str, counter: str) -> str:
+    return f"response_cache:{namespace}:{counter}"
+
+def _increment(key: str):
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+def get_version(namespace: str) -> int:
+    version = cache.get(_version_key(namespace))
+
+    if version is None:
+        cache.add(_version_key(namespace), 1, timeout=None)
+        version = cache.get(_version_key(namespace), 1)
+
+    return version
+
+def invalidate(namespace: str):
+    """
+    Makes every cached response of the namespace stale by moving it to a new
+    version; the old entries simply expire.
+    """
+    try:
+        _increment(_version_key(namespace))
+        logging.getLogger().info("response_cache.invalidate namespace=%s", namespace)
+    except Exception as e:
+        logging.getLogger().exception("response_cache.invalidate exc=%s, namespace=%s", e, namespace)
+
+def get_stats(namespace: str) -> Dict[str, int]:
+    return {
+        "version": get_version(namespace),
+        "hits": cache.get(_counter_key(namespace, "hits"), 0),
+        "misses": cache.get(_counter_key(namespace, "misses"), 0),
+    }
+
+def get_cache_key(namespace: str, endpoint: str, request) -> str:
+    params = sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+    digest = hashlib.md5(f"{endpoint}:{request.path}?{params}".encode()).hexdigest()
+
+    return f"response_cache:{namespace}:v{get_version(namespace)}:{digest}"
+
+def cached_response(namespace: str, timeout: int = None, bypass_params: Iterable[str] = ()):
+    """
+    Caches the successful responses of a view method, keyed by view, path and
+    query parameters, until the namespace is invalidated (see steam_api.signals).
+    Requests carrying one of bypass_params (user specific filters) are not cached.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            if any(param in request.query_params for param in bypass_params):
+                return func(self, request, *args, **kwargs)
+
+            try:
+                key = get_cache_key(namespace, func.__qualname__, request)
+                cached = cache.get(key)
+                _increment(_counter_key(namespace, "hits" if cached is not None else "misses"))
+            except Exception as e:
+                # The cache being down must not take the endpoint with it
+                logging.getLogger().exception("response_cache.cached_response exc=%s, namespace=%s", e, namespace)
+                return func(self, request, *args, **kwargs)
+
+            if cached is not None:
+                validators = ResponseValidators.from_headers(cached.get("headers", {}))
+
+                if validators is not None and validators.matches(request):
+                    return RestResponse.not_modified(validators)
+
+                response = Response(cached["data"], status=cached["status"], content_type=cached["content_type"])
+                return validators.apply(response) if validators is not None else response
+
+            response = func(self, request, *args, **kwargs)
+
+            if response.status_code == 200:
+                try:
+                    cache.set(
+                        key,
+                        {
+                            "data": response.data,
+                            "status": response.status_code,
+                            "content_type": response.content_type,
+                            "headers": {header: response[header] for header in ("ETag", "Last-Modified") if response.has_header(header)},
+                        },
+                        timeout=timeout or settings.RESPONSE_CACHE_TIMEOUT
+                    )
+                except Exception as e:
+                    logging.getLogger().exception("response_cache.cached_response exc=%s, namespace=%s", e, namespace)
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,37 @@
+from typing import Any, List
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+def _get_index_key(group: str) -> str:
+    return cache.make_key(f"{group}:_keys")
+
+def register_key(group: str, key: str, value: Any, timeout: int):
+    """
+    Stores value under key and records key in the Redis set of its group, so the
+    whole group can later be removed without scanning the keyspace.
+    """
+    index_key = _get_index_key(group)
+    cache.set(key, value, timeout)
+
+    pipeline = get_redis_connection("default").pipeline()
+    pipeline.sadd(index_key, key)
+    pipeline.expire(index_key, timeout)
+    pipeline.execute()
+
+def remove_group(group: str) -> List[str]:
+    """
+    Deletes every key registered in the group and returns them.
+    """
+    index_key = _get_index_key(group)
+
+    pipeline = get_redis_connection("default").pipeline()
+    pipeline.smembers(index_key)
+    pipeline.delete(index_key)
+    members, _ = pipeline.execute()
+
+    keys = [member.decode() if isinstance(member, bytes) else member for member in members]
+
+    if keys:
+        cache.delete_many(keys)
+
+    return keys
@@ -0,0 +1,17 @@
+from django.db import models
+from django.db.models import Q
+
+class SoftDeleteIndex(models.Index):
+    """
+    Index over the rows that are not soft deleted. Databases that support partial
+    indexes (PostgreSQL, sqlite) get `... WHERE deleted_at IS NULL`; the others
+    (MySQL) get a composite index with deleted_at appended, which serves the same
+    `deleted_at IS NULL` lookups.
+    """
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.features.supports_partial_indexes:
+            index = models.Index(fields=self.fields, name=self.name, condition=Q(deleted_at__isnull=True))
+        else:
+            index = models.Index(fields=[*self.fields, 'deleted_at'], name=self.name)
+
+        return index.create_sql(model, schema_editor, using=using, **kwargs)
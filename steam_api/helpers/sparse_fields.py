@@ -0,0 +1,96 @@
+from typing import Dict, Optional
+from drf_yasg import openapi
+from rest_framework import serializers
+
+SPARSE_FIELDS_PARAMETERS = [
+    openapi.Parameter(
+        'fields',
+        openapi.IN_QUERY,
+        description='Comma separated fields to return, use dots for nested fields (e.g. id,status,lesson.name)',
+        type=openapi.TYPE_STRING,
+        required=False
+    ),
+    openapi.Parameter(
+        'expand',
+        openapi.IN_QUERY,
+        description='Comma separated nested fields to return in full when they are listed in fields without sub-fields (otherwise only their ID is returned)',
+        type=openapi.TYPE_STRING,
+        required=False
+    )
+]
+
+def parse_field_paths(value: Optional[str]) -> Dict[str, Dict]:
+    """
+    Turns "id,lesson.name,lesson.module.id" into {"id": {}, "lesson": {"name": {}, "module": {"id": {}}}}.
+    """
+    tree = {}
+
+    for path in (value or '').split(','):
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+
+    return tree
+
+class SparseFieldsMixin:
+    """
+    Lets a serializer render only part of its fields, either chosen in code with
+    the fields/exclude keyword arguments or by the client with the fields/expand
+    query parameters when the request is in the context. Fields left out are not
+    computed at all, so the queries behind them are skipped too.
+    """
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", [])
+        exclude = kwargs.pop("exclude", [])
+
+        super().__init__(*args, **kwargs)
+
+        if fields:
+            exclude = exclude + list(set(self.fields.keys()) - set(fields))
+
+        for field in exclude:
+            self.fields.pop(field, None)
+
+        request = self.context.get('request')
+
+        if request is not None and request.query_params.get('fields'):
+            self.select_fields(
+                parse_field_paths(request.query_params.get('fields')),
+                parse_field_paths(request.query_params.get('expand'))
+            )
+
+    def select_fields(self, selected: Dict[str, Dict], expand: Dict[str, Dict]):
+        for name in list(self.fields.keys()):
+            if name not in selected:
+                self.fields.pop(name)
+                continue
+
+            field = self.fields[name]
+            nested = field.child if isinstance(field, serializers.ListSerializer) else field
+
+            if selected[name]:
+                if isinstance(nested, SparseFieldsMixin):
+                    nested.select_fields(selected[name], expand.get(name, {}))
+            elif name not in expand and self.__is_collapsible(name, field):
+                self.fields[name] = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    def __is_collapsible(self, name: str, field: serializers.Field) -> bool:
+        """
+        Nested blocks (serializers or method fields) of a foreign key can be
+        replaced by the key itself, which is already on the row.
+        """
+        if not isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+            return False
+
+        model = getattr(getattr(self, 'Meta', None), 'model', None)
+
+        if model is None:
+            return False
+
+        try:
+            model_field = model._meta.get_field(name)
+        except Exception as _:
+            return False
+
+        return model_field.concrete and (model_field.many_to_one or model_field.one_to_one)
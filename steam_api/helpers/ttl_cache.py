@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+class TTLCache():
+    """
+    Small thread-safe in-process LRU cache whose entries expire after `ttl` seconds.
+    """
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+        self.__data = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.__lock:
+            entry = self.__data.get(key, None)
+
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self.__data[key]
+                return default
+
+            self.__data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        ttl = self.__ttl if ttl is None else min(ttl, self.__ttl)
+
+        if self.__maxsize <= 0 or ttl <= 0:
+            return
+
+        with self.__lock:
+            self.__data[key] = (time.monotonic() + ttl, value)
+            self.__data.move_to_end(key)
+
+            while len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__data.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__data.clear()
+
+    def __len__(self) -> int:
+        return len(self.__data)
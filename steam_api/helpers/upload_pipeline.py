@@ -0,0 +1,200 @@
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field as dataclass_field, replace
+from typing import Dict, List, Optional
+from datetime import datetime
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import connections, models, transaction
+
+from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.image_processing import process_image
+
+_executor = ThreadPoolExecutor(max_workers=settings.UPLOAD_WORKERS, thread_name_prefix="drive-upload")
+_staging_executor = ThreadPoolExecutor(max_workers=settings.UPLOAD_WORKERS, thread_name_prefix="image-staging")
+
+@dataclass(frozen=True)
+class StagedFile:
+    name: str
+    path: str
+    url: str
+    variants: Dict[str, "StagedFile"] = dataclass_field(default_factory=dict)
+
+    @property
+    def variant_urls(self) -> Dict[str, str]:
+        return {variant: staged.url for variant, staged in self.variants.items()}
+
+def get_staging_storage() -> FileSystemStorage:
+    return FileSystemStorage(
+        location=os.path.join(settings.MEDIA_ROOT, "pending"),
+        base_url=f"{settings.MEDIA_PUBLIC_URL.rstrip('/')}/pending/"
+    )
+
+def stage_file(file) -> StagedFile:
+    """
+    Saves an uploaded file to the local staging area. The returned url is an
+    absolute url under MEDIA_PUBLIC_URL and stands in for the Drive url until the
+    background upload finishes.
+    """
+    fs = get_staging_storage()
+    name = getattr(file, "name", "upload")
+    filename = fs.save(datetime.now().strftime("%Y%m%d%H%M%S") + name, file)
+
+    return StagedFile(name=name, path=fs.path(filename), url=fs.url(filename))
+
+def stage_image(file) -> StagedFile:
+    """
+    Like stage_file, but the image is normalized and resized first (see
+    process_image) and its smaller variants are staged with it. Files Pillow
+    cannot read are staged unchanged.
+    """
+    processed = process_image(file)
+
+    if processed is None:
+        return stage_file(file)
+
+    return replace(
+        stage_file(processed.file),
+        variants={variant: stage_file(content) for variant, content in processed.variants.items()}
+    )
+
+def stage_images(files: List) -> List[StagedFile]:
+    """
+    Stages several images concurrently, preserving their order.
+    """
+    return list(_staging_executor.map(stage_image, files))
+
+def discard_staged(staged: StagedFile):
+    storage = get_staging_storage()
+    storage.delete(os.path.basename(staged.path))
+
+    for variant_staged in staged.variants.values():
+        storage.delete(os.path.basename(variant_staged.path))
+
+def get_image_variants(staged: StagedFile) -> Dict[str, Dict[str, str]]:
+    """
+    Returns the image_variants entry of a staged image, keyed by its url.
+    """
+    return {staged.url: staged.variant_urls} if staged.variants else {}
+
+def schedule_drive_upload(staged: StagedFile, instance: models.Model, field: str):
+    """
+    Uploads a staged file (and its variants) to Drive in the worker pool once the
+    current transaction commits, then swaps staged.url for the Drive url in
+    instance.<field> and instance.image_variants. The field may hold a single url
+    or a list of urls.
+    """
+    model = type(instance)
+    pk = instance.pk
+
+    transaction.on_commit(lambda: _executor.submit(_upload, staged, model, pk, field))
+
+def restage(url: str, variant_urls: Optional[Dict[str, str]] = None) -> Optional[StagedFile]:
+    """
+    Rebuilds the StagedFile of a url still pointing at the staging area (an upload
+    lost with its worker or out of retries), None if it is not one or its file is gone.
+    """
+    if "/pending/" not in (url or ""):
+        return None
+
+    storage = get_staging_storage()
+    filename = url.rsplit("/pending/", 1)[1]
+
+    if not filename or not storage.exists(filename):
+        return None
+
+    variants = {}
+    for variant, variant_url in (variant_urls or {}).items():
+        variant_staged = restage(variant_url)
+
+        if variant_staged is not None:
+            variants[variant] = variant_staged
+
+    return StagedFile(name=filename, path=storage.path(filename), url=url, variants=variants)
+
+def retry_upload(staged: StagedFile, instance: models.Model, field: str):
+    """
+    Runs the upload of schedule_drive_upload again, synchronously.
+    """
+    _upload(staged, type(instance), instance.pk, field)
+
+def _upload(staged: StagedFile, model, pk, field: str):
+    try:
+        drive_url = _with_retries(lambda: _upload_to_drive(staged), f"upload {staged.path}")
+
+        if drive_url is None:
+            logging.getLogger().error("upload_pipeline._upload gave up file=%s, the local url stays in use until retry_pending_uploads", staged.path)
+            return
+
+        variant_urls = {}
+        for variant, variant_staged in staged.variants.items():
+            variant_urls[variant] = _with_retries(lambda: _upload_to_drive(variant_staged), f"upload {variant_staged.path}") or variant_staged.url
+
+        if _with_retries(lambda: _replace_url(model, pk, field, staged, drive_url, variant_urls), f"replace {staged.url}") is None:
+            return
+
+        storage = get_staging_storage()
+        storage.delete(os.path.basename(staged.path))
+
+        for variant, variant_staged in staged.variants.items():
+            if variant_urls[variant] != variant_staged.url:
+                storage.delete(os.path.basename(variant_staged.path))
+    except Exception as e:
+        logging.getLogger().exception("upload_pipeline._upload exc=%s, model=%s, pk=%s, field=%s", e, model.__name__, pk, field)
+    finally:
+        connections.close_all()
+
+def _upload_to_drive(staged: StagedFile) -> str:
+    with open(staged.path, "rb") as f:
+        return upload_image_to_drive(File(f, name=staged.name))
+
+def _with_retries(func, description: str):
+    for attempt in range(settings.UPLOAD_MAX_RETRIES + 1):
+        try:
+            return func()
+        except Exception as e:
+            logging.getLogger().warning("upload_pipeline._with_retries attempt=%s, task=%s, exc=%s", attempt, description, e)
+
+            if attempt < settings.UPLOAD_MAX_RETRIES:
+                time.sleep(settings.UPLOAD_RETRY_BACKOFF * 2 ** attempt)
+
+    return None
+
+def _replace_url(model, pk, field: str, staged: StagedFile, drive_url: str, variant_urls: Dict[str, str]):
+    with transaction.atomic():
+        instance = model.objects.select_for_update().filter(pk=pk).first()
+
+        if instance is None:
+            return 0
+
+        value = getattr(instance, field)
+
+        # Only replace the staged url, a newer upload may have taken its place meanwhile
+        if isinstance(value, list):
+            if staged.url not in value:
+                return 0
+
+            setattr(instance, field, [drive_url if url == staged.url else url for url in value])
+        else:
+            if value != staged.url:
+                return 0
+
+            setattr(instance, field, drive_url)
+
+        update_fields = [field]
+
+        if staged.variants and hasattr(instance, "image_variants"):
+            image_variants = dict(instance.image_variants or {})
+            image_variants.pop(staged.url, None)
+            image_variants[drive_url] = variant_urls
+            instance.image_variants = image_variants
+            update_fields.append("image_variants")
+
+        if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+            update_fields.append("updated_at")
+
+        instance.save(update_fields=update_fields)
+        return 1
@@ -0,0 +1,78 @@
+import logging
+import threading
+import requests
+from django.conf import settings
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+from steam_api.const.const import ZALO_USER_INFO_API
+from steam_api.helpers.ttl_cache import TTLCache
+
+class ZaloClient():
+    """
+    Client for the Zalo Graph API sharing one pooled keep-alive session per process.
+
+    `transport` is mounted on the session in place of the default retrying
+    HTTPAdapter, e.g. to point the client at a local stub.
+    """
+    def __init__(self, transport: BaseAdapter = None, timeout: float = None, profile_cache_ttl: int = None) -> None:
+        self.__timeout = (settings.ZALO_CONNECT_TIMEOUT, settings.ZALO_READ_TIMEOUT) if timeout is None else timeout
+        self.__profiles = TTLCache(
+            maxsize=settings.ZALO_PROFILE_CACHE_SIZE,
+            ttl=settings.ZALO_PROFILE_CACHE_TTL if profile_cache_ttl is None else profile_cache_ttl
+        )
+
+        if transport is None:
+            transport = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.ZALO_POOL_SIZE,
+                max_retries=Retry(
+                    total=settings.ZALO_MAX_RETRIES,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"]
+                )
+            )
+
+        self.__session = requests.Session()
+        self.__session.mount("https://", transport)
+        self.__session.mount("http://", transport)
+
+    def get_profile(self, access_token: str) -> dict:
+        """
+        Returns the Zalo profile of the owner of access_token. Successful lookups are
+        cached for a short time, errors are returned as-is and not cached.
+        """
+        profile = self.__profiles.get(access_token)
+
+        if profile is not None:
+            return profile
+
+        resp = self.__session.get(
+            url=ZALO_USER_INFO_API,
+            headers={
+                "access_token": access_token
+            },
+            timeout=self.__timeout
+        )
+        logging.getLogger().info("ZaloClient.get_profile resp=%s", resp.text)
+
+        profile = resp.json()
+
+        if profile.get("error", None) == 0:
+            self.__profiles.set(access_token, profile)
+
+        return profile
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_zalo_client() -> ZaloClient:
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ZaloClient()
+
+    return _client
@@ -0,0 +1,84 @@
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from steam_api.models.attendance import Attendance
+from steam_api.models.course_registration import CourseRegistration
+from steam_api.models.lesson_checkin import LessonCheckin
+from steam_api.models.lesson_evaluation import LessonEvaluation
+from steam_api.models.lesson_gallery import LessonGallery
+from steam_api.models.lesson_replacement import LessonReplacement
+from steam_api.models.student_registration import StudentRegistration
+
+def get_hot_queries():
+    """
+    The most frequent soft-delete lookups of the views, with the index each one
+    is expected to use.
+    """
+    return [
+        (
+            'course_reg_class_status_idx',
+            CourseRegistration.objects.filter(class_room_id=1, status='approved', deleted_at__isnull=True)
+        ),
+        (
+            'course_reg_student_status_idx',
+            CourseRegistration.objects.filter(student_id__in=[1, 2], status='approved', deleted_at__isnull=True)
+        ),
+        (
+            'student_reg_user_status_idx',
+            StudentRegistration.objects.filter(app_user_id=1, status='approved', deleted_at__isnull=True)
+        ),
+        (
+            'attendance_lesson_idx',
+            Attendance.objects.filter(lesson_id=1, deleted_at__isnull=True).order_by('-check_in_time')
+        ),
+        (
+            'lesson_eval_student_idx',
+            LessonEvaluation.objects.filter(student_id=1, deleted_at__isnull=True).order_by()
+        ),
+        (
+            'lesson_repl_lesson_idx',
+            LessonReplacement.objects.filter(lesson_id=1, deleted_at__isnull=True).order_by('schedule')
+        ),
+        (
+            'lesson_checkin_lesson_idx',
+            LessonCheckin.objects.filter(lesson_id=1, deleted_at__isnull=True)
+        ),
+        (
+            'lesson_gallery_lesson_idx',
+            LessonGallery.objects.filter(lesson_id=1, deleted_at__isnull=True).order_by()
+        ),
+    ]
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN on the hot soft-delete queries and check that they use their indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plan', action='store_true', dest='verbose_plan', help='Print the full query plans')
+
+    def handle(self, *args, **options):
+        failures = []
+
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Small (development) tables are cheaper to scan, make the planner show the index it would use
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for index_name, queryset in get_hot_queries():
+                plan = queryset.explain()
+                used = index_name in plan
+
+                logging.getLogger().info("check_query_indexes index=%s used=%s", index_name, used)
+                self.stdout.write(f"{'OK' if used else 'MISSING'} {index_name}")
+
+                if options.get('verbose_plan') or not used:
+                    self.stdout.write(plan)
+
+                if not used:
+                    failures.append(index_name)
+
+        if failures:
+            raise CommandError(f"Queries not using their index: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS("All hot queries use their indexes!"))
@@ -0,0 +1,16 @@
+import logging
+from django.core.management.base import BaseCommand
+
+from steam_api.models.lesson import Lesson
+
+class Command(BaseCommand):
+    help = "Move the lessons soft-deleted before lessons were parked on delete to a negative sequence number, freeing their place in the module"
+
+    def handle(self, *args, **options):
+        lessons = Lesson.objects.filter(deleted_at__isnull=False, sequence_number__gt=0)
+        count = lessons.count()
+
+        Lesson.park_deleted(lessons)
+        logging.getLogger().info("park_deleted_lessons count=%s", count)
+
+        self.stdout.write(self.style.SUCCESS(f"{count} deleted lesson(s) parked!"))
@@ -0,0 +1,23 @@
+import logging
+from django.core.management.base import BaseCommand
+
+from steam_api.models.class_room import ClassRoom
+from steam_api.models.lesson_occurrence import LessonOccurrence
+
+class Command(BaseCommand):
+    help = "Rebuild the lesson occurrence table (lesson dates with replacements applied) for every class"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--class-room', type=int, dest='class_room', help='Only rebuild this class room ID')
+
+    def handle(self, *args, **options):
+        class_rooms = ClassRoom.objects.filter(deleted_at__isnull=True)
+
+        if options.get('class_room'):
+            class_rooms = class_rooms.filter(id=options['class_room'])
+
+        for class_room in class_rooms.iterator():
+            LessonOccurrence.rebuild_for_class_room(class_room)
+            logging.getLogger().info("rebuild_lesson_calendar class_room=%s", class_room.id)
+
+        self.stdout.write(self.style.SUCCESS("Lesson calendar rebuilt!"))
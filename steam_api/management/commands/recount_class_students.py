@@ -0,0 +1,22 @@
+import logging
+from django.core.management.base import BaseCommand
+
+from steam_api.models.class_room import ClassRoom
+
+class Command(BaseCommand):
+    help = "Recompute the approved students counter of every class from its registrations"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--class-room', type=int, dest='class_room', help='Only recount this class room ID')
+
+    def handle(self, *args, **options):
+        class_rooms = ClassRoom.objects.filter(deleted_at__isnull=True)
+
+        if options.get('class_room'):
+            class_rooms = class_rooms.filter(id=options['class_room'])
+
+        for class_room in class_rooms.iterator():
+            class_room.recount_students()
+            logging.getLogger().info("recount_class_students class_room=%s count=%s", class_room.id, class_room.approved_students_count)
+
+        self.stdout.write(self.style.SUCCESS("Class students recounted!"))
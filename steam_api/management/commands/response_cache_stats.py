@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from steam_api.helpers import response_cache
+from steam_api.signals import RESPONSE_CACHE_NAMESPACES
+
+class Command(BaseCommand):
+    help = "Show the hit/miss counters of the cached responses, optionally invalidating them"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--invalidate', action='store_true', dest='invalidate', help='Invalidate every namespace afterwards')
+
+    def handle(self, *args, **options):
+        for namespace in sorted(set(RESPONSE_CACHE_NAMESPACES.values())):
+            stats = response_cache.get_stats(namespace)
+            self.stdout.write(f"{namespace}: version={stats['version']} hits={stats['hits']} misses={stats['misses']}")
+
+            if options.get('invalidate'):
+                response_cache.invalidate(namespace)
+
+        if options.get('invalidate'):
+            self.stdout.write(self.style.SUCCESS("Cached responses invalidated!"))
@@ -0,0 +1,55 @@
+import logging
+import os
+import time
+from django.core.management.base import BaseCommand
+
+from steam_api.helpers.upload_pipeline import restage, retry_upload
+from steam_api.models.class_room import ClassRoom
+from steam_api.models.course import Course
+from steam_api.models.facility_image import FacilityImage
+from steam_api.models.lesson_gallery import LessonGallery
+from steam_api.models.news import News
+from steam_api.models.student import Student
+
+# Fields schedule_drive_upload fills, LessonGallery.image_urls holds a list of urls
+UPLOAD_FIELDS = [
+    (News, 'image'),
+    (FacilityImage, 'image_url'),
+    (LessonGallery, 'image_urls'),
+    (Course, 'thumbnail_url'),
+    (Student, 'avatar_url'),
+    (ClassRoom, 'thumbnail_url'),
+]
+
+class Command(BaseCommand):
+    help = "Upload again to Drive the images whose rows still point at the local staging area (lost or failed background uploads)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-age', type=int, dest='min_age', default=30, help='Only retry files staged at least this many minutes ago (default 30), younger ones may still be uploading')
+        parser.add_argument('--dry-run', action='store_true', dest='dry_run', help='Only list the pending uploads')
+
+    def handle(self, *args, **options):
+        staged_before = time.time() - options['min_age'] * 60
+        retried = 0
+
+        for model, field in UPLOAD_FIELDS:
+            # Loaded up front, the uploads close the database connections when they end
+            instances = list(model.objects.filter(deleted_at__isnull=True, **{f'{field}__icontains': '/pending/'}))
+
+            for instance in instances:
+                value = getattr(instance, field)
+
+                for url in (value if isinstance(value, list) else [value]):
+                    staged = restage(url, (instance.image_variants or {}).get(url))
+
+                    if staged is None or os.path.getmtime(staged.path) > staged_before:
+                        continue
+
+                    logging.getLogger().info("retry_pending_uploads model=%s, pk=%s, field=%s, url=%s", model.__name__, instance.pk, field, url)
+                    self.stdout.write(f"{model.__name__} {instance.pk} {field}: {url}")
+                    retried += 1
+
+                    if not options['dry_run']:
+                        retry_upload(staged, instance, field)
+
+        self.stdout.write(self.style.SUCCESS(f"{retried} pending upload(s) {'found' if options['dry_run'] else 'retried'}!"))
@@ -1,10 +1,17 @@
 import logging
+from django.conf import settings
 from django.core.cache import cache
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import NotAuthenticated, AuthenticationFailed
 
+from steam_api.helpers.ttl_cache import TTLCache
+from steam_api.helpers.model_snapshot import take_snapshot, restore_snapshot
 from steam_api.models.app_user import AppUser
 
+# AppUser snapshots by mini app token, in front of the Redis session keys. The
+# snapshot lives only for APP_AUTH_CACHE_TTL, so profile changes show up within it.
+app_sessions = TTLCache(maxsize=settings.APP_AUTH_CACHE_SIZE, ttl=settings.APP_AUTH_CACHE_TTL)
+
 class AppAuthentication(BaseAuthentication):
     def authenticate(self, request):
         try:
@@ -14,14 +21,18 @@ class AppAuthentication(BaseAuthentication):
                 raise NotAuthenticated("Missing token!")
             
             token = bearer_token.replace("Bearer ", "")
-            session_data = cache.get(f"app_session:access:{token}", default=None)
+            snapshot = app_sessions.get(token)
 
-            if session_data is None:
-                raise AuthenticationFailed("Verify token failed!")
-            
-            user = AppUser.objects.get(app_user_id=session_data["user_id"])
-            
-            return (user, token)
+            if snapshot is None:
+                session_data = cache.get(f"app_session:access:{token}", default=None)
+
+                if session_data is None:
+                    raise AuthenticationFailed("Verify token failed!")
+
+                snapshot = take_snapshot(AppUser.objects.get(app_user_id=session_data["user_id"]))
+                app_sessions.set(token, snapshot)
+
+            return (restore_snapshot(AppUser, snapshot), token)
         except Exception as e:
             logging.getLogger().info("MiniAppAuthentication.authenticate exc=%s", e)
             raise AuthenticationFailed("Verify token failed!")
\ No newline at end of file
@@ -1,11 +1,23 @@
+import time
+import jwt
+from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import NotAuthenticated, AuthenticationFailed
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.core.cache import cache
 
+from steam_api.helpers.ttl_cache import TTLCache
+from steam_api.helpers.model_snapshot import take_snapshot, restore_snapshot
 from steam_api.models.web_user import WebUser
 
+# Verified access tokens by jti: {"token", "claims", "user"}. The Redis session key is
+# still checked on every request, so a logout/new login is honoured immediately.
+verified_tokens = TTLCache(maxsize=settings.WEB_AUTH_CACHE_SIZE, ttl=settings.WEB_AUTH_CACHE_TTL)
+
+def forget_verified_token(jti: str):
+    verified_tokens.delete(jti)
+
 class WebUserAuthentication(BaseAuthentication):
     def authenticate(self, request):
         bearer_token = request.headers.get("Authorization", None)
@@ -14,16 +26,44 @@ class WebUserAuthentication(BaseAuthentication):
             raise NotAuthenticated("Missing token!")
         
         token = bearer_token.replace("Bearer ", "")
+        verified = self.__get_verified_token(token)
+        user_id = verified["claims"].get("user_id", None)
+        jti = verified["claims"]["jti"]
 
+        if not bool(cache.has_key(f"web_session:{user_id}:access:{jti}")):
+            forget_verified_token(jti)
+            raise AuthenticationFailed("Verify token failed!")
+        
+        account = restore_snapshot(WebUser, verified["user"])
+        
+        return (account, token)
+    
+    def __get_verified_token(self, token: str) -> dict:
         try:
-            user_id = AccessToken(token=token).payload.get("user_id", None)
-            jti = AccessToken(token=token).payload["jti"]
+            jti = jwt.decode(token, options={"verify_signature": False}).get("jti", None)
+        except jwt.PyJWTError:
+            raise AuthenticationFailed("Verify token failed!")
+
+        verified = verified_tokens.get(jti) if jti else None
+
+        if verified is not None and verified["token"] == token and verified["claims"]["exp"] > time.time():
+            return verified
+
+        try:
+            claims = dict(AccessToken(token=token).payload)
         except TokenError:
             raise AuthenticationFailed("Verify token failed!")
 
-        if not bool(cache.has_key(f"web_session:{user_id}:access:{jti}")):
+        account = WebUser.objects.filter(id=claims.get("user_id", None)).first()
+
+        if account is None:
             raise AuthenticationFailed("Verify token failed!")
-        
-        account = WebUser.objects.get(id=user_id)
-        
-        return (account, token)
\ No newline at end of file
+
+        verified = {
+            "token": token,
+            "claims": claims,
+            "user": take_snapshot(account),
+        }
+        verified_tokens.set(claims["jti"], verified, ttl=claims["exp"] - time.time())
+
+        return verified
@@ -2,12 +2,16 @@ from django.db import models
 from django.utils import timezone
 from steam_api.models.student import Student
 from steam_api.models.lesson import Lesson
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class Attendance(models.Model):
     class Meta:
         db_table = "attendances"
         unique_together = ['student', 'lesson']
         ordering = ['-check_in_time']
+        indexes = [
+            SoftDeleteIndex(fields=['lesson', '-check_in_time'], name='attendance_lesson_idx'),
+        ]
 
     STATUS_CHOICES = [
         ('present', 'Present'),
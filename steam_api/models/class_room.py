@@ -1,10 +1,13 @@
+import copy
 from django.db import models
+from django.db.models import F, Q
 from django.utils import timezone
 from steam_api.models.course import Course
 from steam_api.models.web_user import WebUser
 from steam_api.models.student import Student
+from steam_api.models.image_variants import ImageVariantsModel
 
-class ClassRoom(models.Model):
+class ClassRoom(ImageVariantsModel):
     class Meta:
         db_table = "class_rooms"
         
@@ -16,6 +19,7 @@ class ClassRoom(models.Model):
     teacher = models.ForeignKey(WebUser, on_delete=models.SET_NULL, null=True, related_name='teaching_classes')
     teaching_assistant = models.ForeignKey(WebUser, on_delete=models.SET_NULL, null=True, related_name='assisting_classes')
     max_students = models.IntegerField(default=20)
+    approved_students_count = models.PositiveIntegerField(default=0, help_text="Number of approved registrations, maintained by CourseRegistration.save")
     start_date = models.DateField()
     end_date = models.DateField()
     schedule = models.JSONField(help_text="Weekly schedule in JSON format", null=True, blank=True)
@@ -24,6 +28,42 @@ class ClassRoom(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True)
 
+    TRACKED_FIELDS = ['schedule', 'start_date']
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {field: copy.deepcopy(getattr(instance, field)) for field in cls.TRACKED_FIELDS if field in field_names}
+        return instance
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # The counter is only changed through the seat methods below, never write back a stale copy
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'approved_students_count'
+            ]
+
+        update_fields = kwargs.get('update_fields')
+        old_values = None
+
+        if not self._state.adding and (update_fields is None or set(self.TRACKED_FIELDS) & set(update_fields)):
+            old_values = getattr(self, '_loaded_values', {})
+
+            if set(old_values) != set(self.TRACKED_FIELDS):
+                # Instance not loaded from the database (or loaded with only()), fall back to a query
+                old_values = ClassRoom.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+
+        super().save(*args, **kwargs)
+
+        changed = old_values is not None and any(old_values[field] != getattr(self, field) for field in self.TRACKED_FIELDS)
+        self._loaded_values = {field: copy.deepcopy(getattr(self, field)) for field in self.TRACKED_FIELDS}
+
+        if changed:
+            # Import here to avoid circular import
+            from steam_api.models.lesson_occurrence import LessonOccurrence
+            LessonOccurrence.rebuild_for_class_room(self)
+
     @property
     def total_sessions(self):
         return sum(module.total_lessons for module in self.modules.filter(deleted_at__isnull=True))
@@ -40,7 +80,56 @@ class ClassRoom(models.Model):
 
     @property
     def current_students_count(self):
-        return self.approved_students.count()
+        return self.approved_students_count
+
+    @classmethod
+    def reserve_seat(cls, class_room_id: int):
+        """
+        Takes one seat of the class in a single conditional UPDATE, so concurrent
+        approvals can never push the class over max_students.
+        """
+        # Import here to avoid circular import
+        from steam_api.errors.class_room_full_exception import ClassRoomFullException
+
+        updated = cls.objects.filter(
+            pk=class_room_id,
+            approved_students_count__lt=F('max_students')
+        ).update(approved_students_count=F('approved_students_count') + 1)
+
+        if not updated:
+            raise ClassRoomFullException()
+
+    @classmethod
+    def release_seat(cls, class_room_id: int):
+        cls.release_seats([class_room_id])
+
+    @classmethod
+    def release_seats(cls, class_room_ids: list):
+        cls.objects.filter(
+            pk__in=class_room_ids,
+            approved_students_count__gt=0
+        ).update(approved_students_count=F('approved_students_count') - 1)
+
+    @classmethod
+    def restore_seats(cls, class_room_ids: list):
+        """
+        Gives a reactivated student back their seat in each class, even in a class
+        filled meanwhile: they are on its roster again whatever max_students says.
+        """
+        cls.objects.filter(pk__in=class_room_ids).update(approved_students_count=F('approved_students_count') + 1)
+
+    def recount_students(self):
+        """
+        Recomputes approved_students_count from the registrations, for classes
+        created before the counter existed or edited outside the ORM. Like the
+        roster, registrations of inactive or deleted students are not counted.
+        """
+        self.approved_students_count = self.course_registrations.filter(
+            Q(student__isnull=True) | Q(student__is_active=True, student__deleted_at__isnull=True),
+            status='approved',
+            deleted_at__isnull=True
+        ).count()
+        ClassRoom.objects.filter(pk=self.pk).update(approved_students_count=self.approved_students_count)
 
     @property
     def available_slots(self):
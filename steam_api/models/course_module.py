@@ -19,16 +19,28 @@ class CourseModule(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True)
         
+    TRACKED_FIELDS = ['total_lessons', 'sequence_number', 'deleted_at']
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {field: getattr(instance, field) for field in cls.TRACKED_FIELDS if field in field_names}
+        return instance
+
     def save(self, *args, **kwargs):
         is_new = self._state.adding
+        old_values = None
         old_total_lessons = None
         
         if not is_new:
-            try:
-                old_instance = CourseModule.objects.get(pk=self.pk)
-                old_total_lessons = old_instance.total_lessons
-            except CourseModule.DoesNotExist:
-                pass
+            old_values = getattr(self, '_loaded_values', {})
+
+            if set(old_values) != set(self.TRACKED_FIELDS):
+                # Instance not loaded from the database (or loaded with only()), fall back to a query
+                old_values = CourseModule.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+
+            if old_values is not None:
+                old_total_lessons = old_values['total_lessons']
                 
         # Save the module first
         super().save(*args, **kwargs)
@@ -65,6 +77,17 @@ class CourseModule(models.Model):
                     sequence_number__gt=self.total_lessons,
                     deleted_at__isnull=True
                 ).update(deleted_at=timezone.now())
+                Lesson.park_deleted(Lesson.objects.filter(module=self))
+
+        changed = is_new or old_values is None or any(
+            old_values[field] != getattr(self, field)
+            for field in self.TRACKED_FIELDS
+        )
+        self._loaded_values = {field: getattr(self, field) for field in self.TRACKED_FIELDS}
+
+        if changed:
+            from steam_api.models.lesson_occurrence import LessonOccurrence
+            LessonOccurrence.rebuild_for_class_room(self.class_room)
                 
     def delete(self, *args, **kwargs):
         # Soft delete all related lessons
@@ -1,7 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from steam_api.models.student import Student
 from steam_api.models.class_room import ClassRoom
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class CourseRegistration(models.Model):
     class Meta:
@@ -13,6 +14,10 @@ class CourseRegistration(models.Model):
                 name='unique_student_classroom_when_not_deleted'
             )
         ]
+        indexes = [
+            SoftDeleteIndex(fields=['class_room', 'status'], name='course_reg_class_status_idx'),
+            SoftDeleteIndex(fields=['student', 'status'], name='course_reg_student_status_idx'),
+        ]
         
     id = models.BigAutoField(primary_key=True)
     student = models.ForeignKey(Student,null=True, on_delete=models.CASCADE, related_name='course_registrations')
@@ -47,7 +52,22 @@ class CourseRegistration(models.Model):
 
     def __str__(self):
         return f"{self.student.first_name} - {self.class_room.name} ({self.status})"
-        
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_seat = instance.seat_class_room_id
+        return instance
+
+    @property
+    def seat_class_room_id(self):
+        """
+        The class whose approved_students_count this registration counts towards, if any.
+        """
+        if self.status == 'approved' and self.deleted_at is None:
+            return self.class_room_id
+        return None
+
     def save(self, *args, **kwargs):
         if self.paid_amount >= self.amount:
             self.payment_status = 'fully_paid'
@@ -55,5 +75,24 @@ class CourseRegistration(models.Model):
             self.payment_status = 'partially_paid'
         else:
             self.payment_status = 'unpaid'
-            
-        super().save(*args, **kwargs) 
\ No newline at end of file
+
+        loaded_seat = getattr(self, '_loaded_seat', None)
+        seat = self.seat_class_room_id
+
+        # Registrations of inactive or deleted students hold no seat, Student.save
+        # releases and restores them with the student
+        if loaded_seat == seat or (self.student is not None and not self.student.holds_seats):
+            super().save(*args, **kwargs)
+            self._loaded_seat = seat
+            return
+
+        with transaction.atomic():
+            if seat is not None:
+                ClassRoom.reserve_seat(seat)
+
+            if loaded_seat is not None:
+                ClassRoom.release_seat(loaded_seat)
+
+            super().save(*args, **kwargs)
+
+        self._loaded_seat = seat 
\ No newline at end of file
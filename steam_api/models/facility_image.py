@@ -1,8 +1,9 @@
 from django.db import models
 from steam_api.models.facility import Facility
 from django.conf import settings
+from steam_api.models.image_variants import ImageVariantsModel
 
-class FacilityImage(models.Model):
+class FacilityImage(ImageVariantsModel):
     class Meta:
         db_table = "facility_image"
         verbose_name = "Facility Image"
@@ -0,0 +1,11 @@
+from django.db import models
+
+class ImageVariantsModel(models.Model):
+    """
+    Base of the models whose images go through the upload pipeline, which stores
+    the resized copies of every image here.
+    """
+    class Meta:
+        abstract = True
+
+    image_variants = models.JSONField(default=dict, blank=True, help_text="Smaller copies of the image(s), keyed by image URL then variant name")
@@ -1,8 +1,10 @@
 from datetime import datetime
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, Value, When
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from steam_api.models.course_module import CourseModule
-from steam_api.helpers.lesson_schedule import calculate_lesson_status, get_lesson_start_datetime, get_lesson_end_datetime
+from steam_api.helpers.lesson_schedule import calculate_occurrence_status
 from zoneinfo import ZoneInfo
 
 class Lesson(models.Model):
@@ -22,67 +24,81 @@ class Lesson(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True)
 
+    # Lessons being renumbered are moved above this offset first, so that no
+    # intermediate state breaks the (module, sequence_number) unique constraint
+    RESEQUENCE_OFFSET = 1000000
+
     def __str__(self):
         return f"{self.module.class_room.name} - {self.module.name} - {self.name} (Lesson {self.sequence_number})"
+
+    @classmethod
+    def park_deleted(cls, queryset: models.QuerySet):
+        """
+        Moves soft-deleted lessons to a negative sequence number (-id) to free
+        their place in the module for live lessons.
+        """
+        queryset.filter(deleted_at__isnull=False, sequence_number__gt=0).update(sequence_number=-F('id'), updated_at=timezone.now())
+
+    @classmethod
+    def close_gap(cls, module_id: int, sequence_number: int):
+        """
+        Shifts the live lessons after sequence_number one place down, in two
+        UPDATE statements whatever the number of lessons.
+        """
+        with transaction.atomic():
+            later_lessons = cls.objects.filter(module_id=module_id, sequence_number__gt=sequence_number, deleted_at__isnull=True)
+            later_lessons.update(sequence_number=F('sequence_number') + cls.RESEQUENCE_OFFSET)
+
+            cls.objects.filter(
+                module_id=module_id,
+                sequence_number__gt=cls.RESEQUENCE_OFFSET
+            ).update(sequence_number=F('sequence_number') - cls.RESEQUENCE_OFFSET - 1, updated_at=timezone.now())
+
+    @classmethod
+    def reorder(cls, module_id: int, lesson_ids: list):
+        """
+        Renumbers the live lessons of the module in the order of lesson_ids,
+        which must contain every one of them exactly once.
+        """
+        with transaction.atomic():
+            lessons = cls.objects.filter(module_id=module_id, deleted_at__isnull=True)
+            lessons.update(sequence_number=F('sequence_number') + cls.RESEQUENCE_OFFSET)
+            lessons.update(
+                sequence_number=Case(
+                    *[When(id=lesson_id, then=Value(index)) for index, lesson_id in enumerate(lesson_ids, start=1)],
+                    output_field=models.IntegerField()
+                ),
+                updated_at=timezone.now()
+            )
         
+    def get_occurrence(self):
+        # Import here to avoid circular import
+        from steam_api.models.lesson_occurrence import LessonOccurrence
+
+        try:
+            return self.occurrence
+        except LessonOccurrence.DoesNotExist:
+            self.occurrence = LessonOccurrence.for_lesson(self)
+            return self.occurrence
+
     @property
     def status(self) -> str:
         class_room = self.module.class_room
-        if not class_room.schedule:
-            return 'not_started'
-            
-        previous_lessons = 0
-        for module in class_room.modules.filter(
-            sequence_number__lt=self.module.sequence_number,
-            deleted_at__isnull=True
-        ):
-            previous_lessons += module.total_lessons
-            
-        absolute_sequence = previous_lessons + self.sequence_number
-        
-        return calculate_lesson_status(
+        occurrence = self.get_occurrence()
+
+        return calculate_occurrence_status(
             start_date=class_room.start_date,
             end_date=class_room.end_date,
-            schedule=class_room.schedule,
-            lesson_sequence=absolute_sequence
+            start_datetime=occurrence.start_datetime,
+            end_datetime=occurrence.end_datetime
         )
     
     @property
     def start_datetime(self) -> datetime:
-        replacement = self.replacements.filter(
-            deleted_at__isnull=True
-        ).order_by('schedule').first()
-        
-        if replacement:
-            return replacement.schedule.astimezone(ZoneInfo('Asia/Ho_Chi_Minh'))
-        
-        return get_lesson_start_datetime(
-            start_date=self.module.class_room.start_date,
-            schedule=self.module.class_room.schedule,
-            lesson_sequence=self.sequence_number
-        )
+        start_at = self.get_occurrence().start_datetime
+        return start_at.astimezone(ZoneInfo('Asia/Ho_Chi_Minh')) if start_at else None
     
     @property
-    def end_datetime(self) -> datetime:      
-        end_at = get_lesson_end_datetime(
-            start_date=self.module.class_room.start_date,
-            schedule=self.module.class_room.schedule,
-            lesson_sequence=self.sequence_number
-        )
-        start_at = get_lesson_start_datetime(
-            start_date=self.module.class_room.start_date,
-            schedule=self.module.class_room.schedule,
-            lesson_sequence=self.sequence_number
-        )
-        
-        replacement = self.replacements.filter(
-            lesson=self,
-            deleted_at__isnull=True
-        ).order_by('schedule').first()
-        
-        duration = end_at - start_at
-        
-        if replacement:
-            return replacement.schedule.astimezone(ZoneInfo('Asia/Ho_Chi_Minh')) + duration
-        
-        return end_at
\ No newline at end of file
+    def end_datetime(self) -> datetime:
+        end_at = self.get_occurrence().end_datetime
+        return end_at.astimezone(ZoneInfo('Asia/Ho_Chi_Minh')) if end_at else None
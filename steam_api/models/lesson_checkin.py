@@ -2,6 +2,7 @@ from django.db import models
 from django.utils import timezone
 from steam_api.models.lesson import Lesson
 from steam_api.models.web_user import WebUser
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class LessonCheckinType(models.TextChoices):
     TEACHER = 'teacher', 'Teacher'
@@ -11,6 +12,9 @@ class LessonCheckin(models.Model):
     class Meta:
         db_table = "lesson_checkins"
         unique_together = ('lesson', 'user')
+        indexes = [
+            SoftDeleteIndex(fields=['lesson'], name='lesson_checkin_lesson_idx'),
+        ]
         
     id = models.BigAutoField(primary_key=True)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='checkins')
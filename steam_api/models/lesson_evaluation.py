@@ -2,12 +2,16 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from steam_api.models.lesson import Lesson
 from steam_api.models.student import Student
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class LessonEvaluation(models.Model):
     class Meta:
         db_table = "lesson_evaluations"
         unique_together = ('lesson', 'student')
         ordering = ['lesson__module__sequence_number', 'lesson__sequence_number']
+        indexes = [
+            SoftDeleteIndex(fields=['student', 'lesson'], name='lesson_eval_student_idx'),
+        ]
         
     id = models.BigAutoField(primary_key=True)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='evaluations')
@@ -1,12 +1,19 @@
 from django.db import models
 from steam_api.models.lesson import Lesson
 from django.conf import settings
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
+from steam_api.models.image_variants import ImageVariantsModel
 
-class LessonGallery(models.Model):
+class LessonGallery(ImageVariantsModel):
     class Meta:
         db_table = "lesson_galleries"
         ordering = ['lesson__sequence_number']
+        indexes = [
+            SoftDeleteIndex(fields=['lesson'], name='lesson_gallery_lesson_idx'),
+        ]
         
+    MAX_IMAGES = 5
+
     id = models.BigAutoField(primary_key=True)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='galleries')
     image_urls = models.JSONField(default=list, help_text="List of image URLs for this lesson")
@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+from zoneinfo import ZoneInfo
+from django.db import models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from steam_api.models.class_room import ClassRoom
+from steam_api.models.lesson import Lesson
+from steam_api.helpers.lesson_schedule import compile_schedule
+
+class LessonOccurrence(models.Model):
+    class Meta:
+        db_table = "lesson_occurrences"
+        ordering = ['absolute_sequence']
+        indexes = [
+            models.Index(fields=['class_room', 'absolute_sequence'], name='lesson_occ_class_seq_idx'),
+            models.Index(fields=['lesson_date'], name='lesson_occ_date_idx'),
+            models.Index(fields=['start_datetime', 'end_datetime'], name='lesson_occ_range_idx'),
+        ]
+
+    id = models.BigAutoField(primary_key=True)
+    lesson = models.OneToOneField(Lesson, on_delete=models.CASCADE, related_name='occurrence')
+    class_room = models.ForeignKey(ClassRoom, on_delete=models.CASCADE, related_name='lesson_occurrences')
+    absolute_sequence = models.IntegerField(help_text="The sequence number of this lesson across all modules of the class")
+    lesson_date = models.DateField(null=True, help_text="Local (Asia/Ho_Chi_Minh) date of the lesson")
+    start_datetime = models.DateTimeField(null=True)
+    end_datetime = models.DateTimeField(null=True)
+    is_replaced = models.BooleanField(default=False, help_text="Whether the dates come from an active lesson replacement")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.class_room.name} - Lesson #{self.absolute_sequence} ({self.start_datetime})"
+
+    @classmethod
+    def build(cls, lesson: Lesson, class_room: ClassRoom, absolute_sequence: int, replacement_schedule: Optional[datetime] = None) -> "LessonOccurrence":
+        start_at = end_at = None
+
+        # Parked (deleted) lessons have no place in the calendar
+        if class_room.schedule and lesson.sequence_number > 0:
+            schedule = compile_schedule(class_room.start_date, class_room.schedule)
+            start_at = schedule.get_lesson_start_datetime(absolute_sequence)
+            end_at = schedule.get_lesson_end_datetime(absolute_sequence)
+
+        is_replaced = replacement_schedule is not None and start_at is not None and end_at is not None
+
+        if is_replaced:
+            duration = end_at - start_at
+            start_at = replacement_schedule.astimezone(ZoneInfo('Asia/Ho_Chi_Minh'))
+            end_at = start_at + duration
+
+        return cls(
+            lesson=lesson,
+            class_room=class_room,
+            absolute_sequence=absolute_sequence,
+            lesson_date=start_at.date() if start_at else None,
+            start_datetime=start_at,
+            end_datetime=end_at,
+            is_replaced=is_replaced
+        )
+
+    @classmethod
+    def status_q(cls, status: str, prefix: str = '', class_room_prefix: str = 'class_room__') -> Q:
+        """
+        SQL counterpart of calculate_occurrence_status, used to filter lessons by
+        status without computing it row by row.
+        """
+        now = timezone.localtime(timezone.now(), ZoneInfo('Asia/Ho_Chi_Minh'))
+        today = now.date()
+
+        unscheduled = Q(**{f'{prefix}start_datetime__isnull': True}) | Q(**{f'{prefix}end_datetime__isnull': True})
+        class_started = Q(**{f'{class_room_prefix}start_date__lte': today})
+        class_ended = Q(**{f'{class_room_prefix}end_date__lt': today})
+
+        if status == 'not_started':
+            return unscheduled | ~class_started | (~class_ended & Q(**{f'{prefix}start_datetime__gt': now}))
+
+        if status == 'completed':
+            return ~unscheduled & class_started & (class_ended | Q(**{f'{prefix}end_datetime__lt': now}))
+
+        if status == 'in_progress':
+            return ~unscheduled & class_started & ~class_ended & Q(**{
+                f'{prefix}start_datetime__lte': now,
+                f'{prefix}end_datetime__gte': now
+            })
+
+        return Q(pk__in=[])
+
+    @classmethod
+    def status_aggregates(cls, prefix: str = '', class_room_prefix: str = 'class_room__') -> dict:
+        """
+        Counts of started and completed occurrences, they change whenever a status
+        computed from the clock does (see ResponseValidators.for_queryset).
+        """
+        return {
+            status: Count('pk', distinct=True, filter=cls.status_q(status, prefix, class_room_prefix))
+            for status in ('in_progress', 'completed')
+        }
+
+    @classmethod
+    def rebuild_for_class_room(cls, class_room: ClassRoom):
+        # Import here to avoid circular import
+        from steam_api.models.course_module import CourseModule
+        from steam_api.models.lesson_replacement import LessonReplacement
+
+        previous_lessons = {}
+        total = 0
+        for module in CourseModule.objects.filter(class_room=class_room, deleted_at__isnull=True).order_by('sequence_number'):
+            previous_lessons[module.id] = total
+            total += module.total_lessons
+
+        lessons = list(Lesson.objects.filter(module_id__in=previous_lessons.keys(), deleted_at__isnull=True))
+
+        replacements = {}
+        for replacement in LessonReplacement.objects.filter(
+            lesson__in=lessons,
+            deleted_at__isnull=True
+        ).order_by('-schedule'):
+            replacements[replacement.lesson_id] = replacement.schedule
+
+        occurrences = [
+            cls.build(
+                lesson=lesson,
+                class_room=class_room,
+                absolute_sequence=previous_lessons[lesson.module_id] + lesson.sequence_number,
+                replacement_schedule=replacements.get(lesson.id)
+            )
+            for lesson in lessons
+        ]
+
+        with transaction.atomic():
+            cls.objects.filter(class_room=class_room).delete()
+            cls.objects.bulk_create(occurrences)
+
+    @classmethod
+    def refresh_for_lesson(cls, lesson: Lesson):
+        # Import here to avoid circular import
+        from steam_api.models.lesson_replacement import LessonReplacement
+
+        occurrence = cls.objects.filter(lesson=lesson).select_related('class_room').first()
+
+        if occurrence is None:
+            cls.rebuild_for_class_room(lesson.module.class_room)
+            return
+
+        replacement = LessonReplacement.objects.filter(
+            lesson=lesson,
+            deleted_at__isnull=True
+        ).order_by('schedule').first()
+
+        refreshed = cls.build(
+            lesson=lesson,
+            class_room=occurrence.class_room,
+            absolute_sequence=occurrence.absolute_sequence,
+            replacement_schedule=replacement.schedule if replacement else None
+        )
+        for field in ['lesson_date', 'start_datetime', 'end_datetime', 'is_replaced']:
+            setattr(occurrence, field, getattr(refreshed, field))
+        occurrence.save(update_fields=['lesson_date', 'start_datetime', 'end_datetime', 'is_replaced', 'updated_at'])
+
+    @classmethod
+    def for_lesson(cls, lesson: Lesson) -> "LessonOccurrence":
+        return cls.compute_for_lessons([lesson])[lesson.id]
+
+    @classmethod
+    def compute_for_lessons(cls, lessons: Iterable[Lesson]) -> Dict[int, "LessonOccurrence"]:
+        """
+        Unsaved occurrences of lessons missing from the calendar, computed like
+        rebuild_for_class_room would: deleted lessons, which are not kept in it, and
+        classes that have not been backfilled yet (rebuild_lesson_calendar command).
+        Reads never write the calendar.
+        """
+        # Import here to avoid circular import
+        from steam_api.models.course_module import CourseModule
+        from steam_api.models.lesson_replacement import LessonReplacement
+
+        lessons = list(lessons)
+
+        modules = {}
+        for module in CourseModule.objects.filter(
+            class_room_id__in={lesson.module.class_room_id for lesson in lessons},
+            deleted_at__isnull=True
+        ):
+            modules.setdefault(module.class_room_id, []).append(module)
+
+        replacements = {}
+        for replacement in LessonReplacement.objects.filter(
+            lesson__in=[lesson for lesson in lessons if lesson.deleted_at is None],
+            deleted_at__isnull=True
+        ).order_by('-schedule'):
+            replacements[replacement.lesson_id] = replacement.schedule
+
+        occurrences = {}
+        for lesson in lessons:
+            previous_lessons = sum(
+                module.total_lessons for module in modules.get(lesson.module.class_room_id, [])
+                if module.sequence_number < lesson.module.sequence_number
+            )
+            occurrences[lesson.id] = cls.build(
+                lesson,
+                lesson.module.class_room,
+                previous_lessons + lesson.sequence_number,
+                replacement_schedule=replacements.get(lesson.id)
+            )
+
+        return occurrences
+
+    @classmethod
+    def attach_to_lessons(cls, lessons: Iterable[Lesson]):
+        """
+        Makes lesson.occurrence available on every lesson with a constant number of
+        queries, computing the ones missing from the calendar without saving them.
+        """
+        missing = []
+        for lesson in lessons:
+            try:
+                lesson.occurrence
+            except cls.DoesNotExist:
+                missing.append(lesson)
+
+        if not missing:
+            return
+
+        occurrences = cls.compute_for_lessons(missing)
+
+        for lesson in missing:
+            lesson.occurrence = occurrences[lesson.id]
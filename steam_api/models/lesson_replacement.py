@@ -1,13 +1,22 @@
 from django.db import models
 from django.db.models import Q
 from steam_api.models.lesson import Lesson
+from steam_api.models.lesson_occurrence import LessonOccurrence
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class LessonReplacement(models.Model):
     class Meta:
         db_table = "lesson_replacements"
+        indexes = [
+            SoftDeleteIndex(fields=['lesson', 'schedule'], name='lesson_repl_lesson_idx'),
+        ]
 
     id = models.BigAutoField(primary_key=True)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='replacements')
     schedule = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
-    deleted_at = models.DateTimeField(null=True)
\ No newline at end of file
+    deleted_at = models.DateTimeField(null=True)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        LessonOccurrence.refresh_for_lesson(self.lesson)
\ No newline at end of file
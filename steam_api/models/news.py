@@ -1,7 +1,8 @@
 from django.db import models
 from django.conf import settings
+from steam_api.models.image_variants import ImageVariantsModel
 
-class News(models.Model):
+class News(ImageVariantsModel):
     class Meta:
         db_table = "news"
         
@@ -1,8 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.conf import settings
+from steam_api.models.image_variants import ImageVariantsModel
 
-class Student(models.Model):
+class Student(ImageVariantsModel):
     class Meta:
         db_table = "students"
         
@@ -26,4 +27,46 @@ class Student(models.Model):
     deleted_at = models.DateTimeField(null=True)
 
     def __str__(self):
-        return f"{self.first_name} {self.last_name} ({self.identification_number})" 
\ No newline at end of file
+        return f"{self.first_name} {self.last_name} ({self.identification_number})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+
+        if 'is_active' in field_names and 'deleted_at' in field_names:
+            instance._loaded_holds_seats = instance.holds_seats
+
+        return instance
+
+    @property
+    def holds_seats(self):
+        """
+        Whether the approved registrations of the student count towards the
+        approved_students_count of their classes, i.e. the student is on the roster.
+        """
+        return self.is_active and self.deleted_at is None
+
+    def save(self, *args, **kwargs):
+        loaded_holds_seats = getattr(self, '_loaded_holds_seats', None)
+
+        if loaded_holds_seats is None or loaded_holds_seats == self.holds_seats:
+            super().save(*args, **kwargs)
+            return
+
+        # Import here to avoid circular import
+        from steam_api.models.class_room import ClassRoom
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            class_room_ids = list(self.course_registrations.filter(
+                status='approved',
+                deleted_at__isnull=True
+            ).values_list('class_room_id', flat=True))
+
+            if self.holds_seats:
+                ClassRoom.restore_seats(class_room_ids)
+            else:
+                ClassRoom.release_seats(class_room_ids)
+
+        self._loaded_holds_seats = self.holds_seats 
\ No newline at end of file
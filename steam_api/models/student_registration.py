@@ -2,6 +2,7 @@ from django.db import models
 from steam_api.models.app_user import AppUser
 from steam_api.models.student import Student
 from django.db.models import Q
+from steam_api.helpers.soft_delete_index import SoftDeleteIndex
 
 class StudentRegistrationStatus(models.TextChoices):
     PENDING = "pending", "Pending"
@@ -18,6 +19,9 @@ class StudentRegistration(models.Model):
                 name='uniq_appuser_student_when_active_or_rejected',
             ),
         ]
+        indexes = [
+            SoftDeleteIndex(fields=['app_user', 'status'], name='student_reg_user_status_idx'),
+        ]
         
     id = models.BigAutoField(primary_key=True)
     app_user = models.ForeignKey(AppUser, on_delete=models.CASCADE, related_name='student_registrations')
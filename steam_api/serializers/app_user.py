@@ -1,11 +1,12 @@
 from rest_framework import serializers
 
 from steam_api.models.app_user import AppUser
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
 class CreateAppSessionSerializer(serializers.Serializer):
     token = serializers.CharField(required=True)
 
-class AppUserSerializer(serializers.ModelSerializer):
+class AppUserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AppUser
         fields = '__all__'
\ No newline at end of file
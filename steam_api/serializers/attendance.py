@@ -1,9 +1,12 @@
 from rest_framework import serializers
 from steam_api.models.attendance import Attendance
+from steam_api.models.lesson import Lesson
 from steam_api.serializers.student import StudentSerializer
 from steam_api.serializers.lesson import LessonSerializer
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
+from steam_api.helpers.bulk_upsert import upsert_lesson_rows
 
-class AttendanceSerializer(serializers.ModelSerializer):
+class AttendanceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     student = serializers.SerializerMethodField()
     lesson = LessonSerializer(read_only=True)
 
@@ -17,4 +20,41 @@ class AttendanceSerializer(serializers.ModelSerializer):
 class CreateAttendanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Attendance
-        fields = ['student', 'lesson', 'status', 'note']
\ No newline at end of file
+        fields = ['student', 'lesson', 'status', 'note']
+
+class BulkAttendanceItemSerializer(serializers.Serializer):
+    student = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES, required=False)
+    note = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+class CreateBulkAttendanceSerializer(serializers.Serializer):
+    lesson = serializers.PrimaryKeyRelatedField(
+        queryset=Lesson.objects.filter(deleted_at__isnull=True).select_related('module__class_room')
+    )
+    attendances = BulkAttendanceItemSerializer(many=True, allow_empty=False)
+
+    def validate_attendances(self, value):
+        student_ids = [item['student'] for item in value]
+
+        if len(student_ids) != len(set(student_ids)):
+            raise serializers.ValidationError("Mỗi học viên chỉ được điểm danh một lần!")
+
+        return value
+
+    def create(self, validated_data):
+        """
+        Writes the attendance of every listed student in one transaction, updating
+        the existing ones with the fields sent (see upsert_lesson_rows).
+        """
+        return upsert_lesson_rows(
+            Attendance,
+            validated_data['lesson'],
+            {item['student']: item for item in validated_data['attendances']},
+            ['status', 'note', 'check_in_time'],
+            prepare=self.__check_in
+        )
+
+    def __check_in(self, attendance, now):
+        # bulk writes bypass Attendance.save, keep its check in rule
+        if attendance.status == 'present' and not attendance.check_in_time:
+            attendance.check_in_time = now
@@ -1,22 +1,75 @@
 from datetime import datetime
+from django.db import models
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework import serializers
 from steam_api.models.class_room import ClassRoom
+from steam_api.models.course_registration import CourseRegistration
 from steam_api.serializers.student import StudentSerializer
 from steam_api.serializers.web_user import WebUserSerializer
 from steam_api.models.web_user import WebUser, WebUserRole, WebUserStatus
 from steam_api.models.course import Course
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class ClassRoomSerializer(serializers.ModelSerializer):
+def approved_registrations_prefetch() -> Prefetch:
+    """
+    Loads the approved registrations of the classes (with their students) in one
+    query, under class_room.approved_registrations.
+    """
+    return Prefetch(
+        'course_registrations',
+        queryset=CourseRegistration.objects.filter(
+            status='approved',
+            deleted_at__isnull=True,
+            student__is_active=True,
+            student__deleted_at__isnull=True
+        ).select_related('student').order_by('student_id'),
+        to_attr='approved_registrations'
+    )
+
+def class_room_queryset(queryset: models.QuerySet = None) -> models.QuerySet:
+    """
+    Class rooms with everything ClassRoomSerializer renders loaded up front.
+    """
+    if queryset is None:
+        queryset = ClassRoom.objects.all()
+
+    return queryset.select_related('teacher', 'teaching_assistant').prefetch_related(approved_registrations_prefetch())
+
+class ClassRoomListSerializer(serializers.ListSerializer):
+    """
+    Makes sure teachers and students are loaded for the whole list at once when
+    the rows were not fetched through class_room_queryset.
+    """
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+
+        class_rooms = list(data)
+        unloaded = [class_room for class_room in class_rooms if not hasattr(class_room, 'approved_registrations')]
+        lookups = [field for field in ['teacher', 'teaching_assistant'] if field in self.child.fields]
+
+        if 'students' in self.child.fields:
+            lookups.append(approved_registrations_prefetch())
+
+        prefetch_related_objects(unloaded, *lookups)
+
+        return super().to_representation(class_rooms)
+
+class ClassRoomSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     teacher = WebUserSerializer(read_only=True)
     teaching_assistant = WebUserSerializer(read_only=True)
     students = serializers.SerializerMethodField()
 
     def get_students(self, obj):
+        if hasattr(obj, 'approved_registrations'):
+            return StudentSerializer([registration.student for registration in obj.approved_registrations], many=True).data
+
         return StudentSerializer(obj.approved_students, many=True).data
     
     class Meta:
         model = ClassRoom
         fields = "__all__"
+        list_serializer_class = ClassRoomListSerializer
 
 class CreateClassRoomSerializer(serializers.ModelSerializer):
     teacher = serializers.PrimaryKeyRelatedField(
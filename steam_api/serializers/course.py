@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from steam_api.models.course import Course
-from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.upload_pipeline import stage_image, get_image_variants, schedule_drive_upload
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Course
         fields = "__all__"
@@ -17,14 +18,22 @@ class CreateCourseSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         thumbnail = validated_data.pop('thumbnail', None)
         
+        staged = None
+        
         if thumbnail:
             try:
-                thumbnail_url = upload_image_to_drive(thumbnail)
-                validated_data['thumbnail_url'] = thumbnail_url
+                staged = stage_image(thumbnail)
+                validated_data['thumbnail_url'] = staged.url
+                validated_data['image_variants'] = get_image_variants(staged)
             except Exception as e:
                 raise serializers.ValidationError({'thumbnail': str(e)})
                 
-        return super().create(validated_data)
+        instance = super().create(validated_data)
+
+        if staged:
+            schedule_drive_upload(staged, instance, 'thumbnail_url')
+
+        return instance
 
 class UpdateCourseSerializer(serializers.ModelSerializer):
     thumbnail = serializers.ImageField(write_only=True, required=False)
@@ -43,11 +52,19 @@ class UpdateCourseSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         thumbnail = validated_data.pop('thumbnail', None)
         
+        staged = None
+        
         if thumbnail:
             try:
-                thumbnail_url = upload_image_to_drive(thumbnail)
-                validated_data['thumbnail_url'] = thumbnail_url
+                staged = stage_image(thumbnail)
+                validated_data['thumbnail_url'] = staged.url
+                validated_data['image_variants'] = get_image_variants(staged)
             except Exception as e:
                 raise serializers.ValidationError({'thumbnail': str(e)})
                 
-        return super().update(instance, validated_data) 
\ No newline at end of file
+        instance = super().update(instance, validated_data)
+
+        if staged:
+            schedule_drive_upload(staged, instance, 'thumbnail_url')
+
+        return instance 
\ No newline at end of file
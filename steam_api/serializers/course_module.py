@@ -2,8 +2,9 @@ from rest_framework import serializers
 from steam_api.models.course_module import CourseModule
 from steam_api.models.lesson import Lesson
 from steam_api.models.class_room import ClassRoom
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class CourseModuleSerializer(serializers.ModelSerializer):
+class CourseModuleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = CourseModule
         fields = "__all__"
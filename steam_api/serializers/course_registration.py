@@ -4,8 +4,9 @@ from steam_api.serializers.student import StudentSerializer
 from steam_api.serializers.class_room import ClassRoomSerializer
 from steam_api.models.student import Student
 from steam_api.models.class_room import ClassRoom
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class CourseRegistrationSerializer(serializers.ModelSerializer):
+class CourseRegistrationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     student = serializers.SerializerMethodField()
     class_room = ClassRoomSerializer(read_only=True)
     
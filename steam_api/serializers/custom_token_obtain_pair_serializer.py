@@ -1,11 +1,12 @@
 import json
 from typing import Any, Dict
-from django.core.cache import cache
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
 from rest_framework_simplejwt.settings import api_settings as jwt_configs
 
 from steam_api.errors.un_verified_exception import UnVerifiedException
+from steam_api.middlewares.web_authentication import forget_verified_token
+from steam_api.helpers.session_registry import register_key, remove_group
 from steam_api.models.web_user import WebUserStatus
 from steam_api.serializers.web_user import WebUserSerializer
 
@@ -34,9 +35,13 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def __save_session(self, key: Any, data: Any, access_jti: str, refresh_jti: str):
         self.__remove_session(key, "access")
         self.__remove_session(key, "refresh")
-        cache.set(f"{self.__prefix_key}:{str(key)}:access:{access_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
-        cache.set(f"{self.__prefix_key}:{str(key)}:refresh:{refresh_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
+        register_key(f"{self.__prefix_key}:{str(key)}:access", f"{self.__prefix_key}:{str(key)}:access:{access_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
+        register_key(f"{self.__prefix_key}:{str(key)}:refresh", f"{self.__prefix_key}:{str(key)}:refresh:{refresh_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
 
     def __remove_session(self, key: Any, type):
-        cache.delete_many(cache.keys(f"{self.__prefix_key}:{str(key)}:{type}:*"))
+        keys = remove_group(f"{self.__prefix_key}:{str(key)}:{type}")
+
+        if type == "access":
+            for session_key in keys:
+                forget_verified_token(session_key.rsplit(":", 1)[-1])
         
\ No newline at end of file
@@ -6,11 +6,13 @@ from rest_framework.serializers import ValidationError
 from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from rest_framework_simplejwt.settings import api_settings as jwt_configs
 
-from bduSuport.models.account import Account
-from bduSuport.serializers.account_serializer import AccountSerializer
+from steam_api.models.web_user import WebUser
+from steam_api.serializers.web_user import WebUserSerializer
+from steam_api.middlewares.web_authentication import forget_verified_token
+from steam_api.helpers.session_registry import register_key, remove_group
 
 class CustomTokenRefreshSerializer(TokenRefreshSerializer):
-    __prefix_key = "session"
+    __prefix_key = "web_session"
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, str]:
         refresh = attrs["refresh"]
@@ -27,8 +29,8 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
         access_jti = self.token_class.access_token_class(_validated_data["access"]).payload["jti"]
 
         user_id = refresh_payload["user_id"]
-        user = Account.objects.get(id=user_id)
-        _session_data = AccountSerializer(user, many=False, exclude=["password"]).data
+        user = WebUser.objects.get(id=user_id)
+        _session_data = WebUserSerializer(user, many=False, exclude=["password"]).data
         self.__save_session(user.id, _session_data, access_jti, refresh_jti)
         
         return _validated_data
@@ -36,8 +38,12 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
     def __save_session(self, key: Any, data: Any, access_jti: str, refresh_jti: str):
         self.__remove_session(key, "access")
         self.__remove_session(key, "refresh")
-        cache.set(f"{self.__prefix_key}:{str(key)}:access:{access_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
-        cache.set(f"{self.__prefix_key}:{str(key)}:refresh:{refresh_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
+        register_key(f"{self.__prefix_key}:{str(key)}:access", f"{self.__prefix_key}:{str(key)}:access:{access_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
+        register_key(f"{self.__prefix_key}:{str(key)}:refresh", f"{self.__prefix_key}:{str(key)}:refresh:{refresh_jti}", json.dumps(data), jwt_configs.ACCESS_TOKEN_LIFETIME.seconds)
 
     def __remove_session(self, key: Any, type):
-        cache.delete_many(cache.keys(f"{self.__prefix_key}:{str(key)}:{type}:*"))
\ No newline at end of file
+        keys = remove_group(f"{self.__prefix_key}:{str(key)}:{type}")
+
+        if type == "access":
+            for session_key in keys:
+                forget_verified_token(session_key.rsplit(":", 1)[-1])
\ No newline at end of file
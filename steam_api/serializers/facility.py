@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from steam_api.models.facility import Facility
 from steam_api.serializers.facility_image import FacilityImageSerializer
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class FacilitySerializer(serializers.ModelSerializer):
+class FacilitySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     images = serializers.SerializerMethodField()
 
     class Meta:
@@ -13,16 +14,6 @@ class FacilitySerializer(serializers.ModelSerializer):
         active_images = obj.images.filter(deleted_at=None)
         return FacilityImageSerializer(active_images, many=True).data
     
-    def __init__(self, *args, **kwargs):
-        existing = set(self.fields.keys())
-        fields = kwargs.pop("fields", []) or existing
-        exclude = kwargs.pop("exclude", [])
-        
-        super().__init__(*args, **kwargs)
-        
-        for field in exclude + list(set(existing) - set(fields)):
-            self.fields.pop(field, None)
-    
     def validate_name(self, value):
         if not value or not value.strip():
             raise serializers.ValidationError("Facility name cannot be empty")
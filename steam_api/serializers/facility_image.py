@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from steam_api.models.facility_image import FacilityImage
 from steam_api.models.facility import Facility
-from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.upload_pipeline import stage_image, get_image_variants, schedule_drive_upload
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class FacilityImageSerializer(serializers.ModelSerializer):
+class FacilityImageSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = FacilityImage
         fields = "__all__"
@@ -16,10 +17,12 @@ class FacilityImageCreateSerializer(serializers.Serializer):
     
     def create(self, validated_data):
         image_file = validated_data.pop('image')
-        image_url = upload_image_to_drive(image_file)
+        staged = stage_image(image_file)
         
         facility_image = FacilityImage.objects.create(
             facility=validated_data['facility'],
-            image_url=image_url
+            image_url=staged.url,
+            image_variants=get_image_variants(staged)
         )
+        schedule_drive_upload(staged, facility_image, 'image_url')
         return facility_image 
\ No newline at end of file
@@ -3,8 +3,37 @@ from django.db import models, transaction
 from steam_api.models.lesson import Lesson
 from steam_api.models.course_module import CourseModule
 from steam_api.models.lesson_evaluation import LessonEvaluation
+from steam_api.models.lesson_occurrence import LessonOccurrence
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class LessonSerializer(serializers.ModelSerializer):
+class LessonListSerializer(serializers.ListSerializer):
+    """
+    Resolves the data every row needs (module, class room, calendar entry and
+    evaluations of the requested student) for the whole list up front.
+    """
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+
+        if isinstance(data, models.QuerySet):
+            data = data.select_related('module', 'module__class_room', 'occurrence')
+
+        lessons = list(data)
+        LessonOccurrence.attach_to_lessons(lessons)
+
+        student_id = self.context.get('student_id')
+        if student_id:
+            self.child.evaluated_lesson_ids = set(
+                LessonEvaluation.objects.filter(
+                    lesson__in=lessons,
+                    student_id=student_id,
+                    deleted_at__isnull=True
+                ).values_list('lesson_id', flat=True)
+            )
+
+        return super().to_representation(lessons)
+
+class LessonSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     is_evaluated = serializers.SerializerMethodField()
     status = serializers.SerializerMethodField(
         help_text="Status of the lesson: 'not_started', 'in_progress', or 'completed'"
@@ -16,12 +45,17 @@ class LessonSerializer(serializers.ModelSerializer):
     class Meta:
         model = Lesson
         fields = "__all__"
+        list_serializer_class = LessonListSerializer
         
     def get_is_evaluated(self, obj):
         student_id = self.context.get('student_id')
         
         if not student_id:
             return None
+
+        evaluated_lesson_ids = getattr(self, 'evaluated_lesson_ids', None)
+        if evaluated_lesson_ids is not None:
+            return obj.id in evaluated_lesson_ids
             
         return LessonEvaluation.objects.filter(
             lesson=obj,
@@ -39,12 +73,19 @@ class LessonSerializer(serializers.ModelSerializer):
         return obj.end_datetime
     
     def get_schedule(self, obj: Lesson):
+        start_datetime = obj.start_datetime
+        end_datetime = obj.end_datetime
+
+        # Unscheduled classes and deleted lessons have no place in the calendar
+        if start_datetime is None or end_datetime is None:
+            return None
+
         return {
-            "start_date": obj.start_datetime.strftime("%d/%m/%Y"),
-            "start_time": obj.start_datetime.strftime("%H:%M"),
-            "end_date": obj.end_datetime.strftime("%d/%m/%Y"),
-            "end_time": obj.end_datetime.strftime("%H:%M"),
-            "duration": (obj.end_datetime - obj.start_datetime).total_seconds() / 60,
+            "start_date": start_datetime.strftime("%d/%m/%Y"),
+            "start_time": start_datetime.strftime("%H:%M"),
+            "end_date": end_datetime.strftime("%d/%m/%Y"),
+            "end_time": end_datetime.strftime("%H:%M"),
+            "duration": (end_datetime - start_datetime).total_seconds() / 60,
             "status": obj.status,
         }
     
@@ -90,4 +131,20 @@ class CreateLessonSerializer(serializers.ModelSerializer):
         module.total_lessons += 1
         module.save(update_fields=['total_lessons'])
 
-        return lesson 
\ No newline at end of file
+        return lesson
+
+class ReorderLessonsSerializer(serializers.Serializer):
+    module = serializers.PrimaryKeyRelatedField(
+        queryset=CourseModule.objects.filter(deleted_at__isnull=True).select_related('class_room')
+    )
+    lessons = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        help_text="IDs of all lessons of the module, in their new order"
+    )
+
+    def validate_lessons(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError("Mỗi bài học chỉ được xuất hiện một lần!")
+
+        return value
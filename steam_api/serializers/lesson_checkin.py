@@ -5,8 +5,9 @@ from steam_api.models.lesson_checkin import LessonCheckin
 from steam_api.models.web_user import WebUser, WebUserRole, WebUserStatus
 from steam_api.serializers.web_user import WebUserSerializer
 from steam_api.serializers.lesson import LessonSerializer
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class LessonCheckinSerializer(serializers.ModelSerializer):
+class LessonCheckinSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = WebUserSerializer(read_only=True)
     lesson = LessonSerializer(read_only=True)
     
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from steam_api.models.lesson_documentation import LessonDocumentation
 from steam_api.models.lesson import Lesson
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class LessonDocumentationSerializer(serializers.ModelSerializer):
+class LessonDocumentationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = LessonDocumentation
         fields = '__all__'
@@ -5,8 +5,10 @@ from steam_api.serializers.student import StudentSerializer
 from steam_api.models.student import Student
 from steam_api.models.lesson import Lesson
 from steam_api.serializers.lesson import LessonSerializer
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
+from steam_api.helpers.bulk_upsert import upsert_lesson_rows
 
-class LessonEvaluationSerializer(serializers.ModelSerializer):
+class LessonEvaluationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     student = serializers.SerializerMethodField()
     lesson = LessonSerializer(read_only=True)
     class_room_name = serializers.CharField(source='lesson.module.class_room.name', read_only=True)
@@ -48,6 +50,46 @@ class CreateLessonEvaluationSerializer(serializers.ModelSerializer):
             'old_knowledge_score', 'new_knowledge_score', 'comment'
         ]
 
+class BulkLessonEvaluationItemSerializer(serializers.ModelSerializer):
+    student = serializers.IntegerField()
+
+    class Meta:
+        model = LessonEvaluation
+        fields = [
+            'student',
+            'focus_score', 'punctuality_score', 'interaction_score', 'project_idea_score',
+            'critical_thinking_score', 'teamwork_score', 'idea_sharing_score',
+            'creativity_score', 'communication_score', 'homework_score',
+            'old_knowledge_score', 'new_knowledge_score', 'comment'
+        ]
+
+class CreateBulkLessonEvaluationSerializer(serializers.Serializer):
+    lesson = serializers.PrimaryKeyRelatedField(
+        queryset=Lesson.objects.filter(deleted_at__isnull=True).select_related('module__class_room')
+    )
+    evaluations = BulkLessonEvaluationItemSerializer(many=True, allow_empty=False)
+
+    def validate_evaluations(self, value):
+        student_ids = [item['student'] for item in value]
+
+        if len(student_ids) != len(set(student_ids)):
+            raise serializers.ValidationError("Mỗi học viên chỉ được đánh giá một lần!")
+
+        return value
+
+    def create(self, validated_data):
+        """
+        Inserts every evaluation in one transaction, reviving soft-deleted ones (see
+        upsert_lesson_rows). An evaluation that exists meanwhile raises IntegrityError.
+        """
+        return upsert_lesson_rows(
+            LessonEvaluation,
+            validated_data['lesson'],
+            {item['student']: item for item in validated_data['evaluations']},
+            [field for field in BulkLessonEvaluationItemSerializer.Meta.fields if field != 'student'],
+            update_live=False
+        )
+
 class UpdateLessonEvaluationSerializer(serializers.ModelSerializer):
     class Meta:
         model = LessonEvaluation
@@ -1,13 +1,51 @@
 from rest_framework import serializers
+from django.db import transaction
 from steam_api.models.lesson_gallery import LessonGallery
-from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.upload_pipeline import stage_image, stage_images, discard_staged, get_image_variants, schedule_drive_upload
 from steam_api.models.lesson import Lesson
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class LessonGallerySerializer(serializers.ModelSerializer):
+class LessonGallerySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = LessonGallery
         fields = "__all__"
 
+def _images_limit_message(gallery: LessonGallery) -> str:
+    remaining = LessonGallery.MAX_IMAGES - gallery.images_count
+
+    if remaining <= 0:
+        return f'Buổi học này đã có số lượng ảnh tối đa ({LessonGallery.MAX_IMAGES})!'
+
+    return f'Buổi học này chỉ còn có thể thêm {remaining} ảnh!'
+
+def _append_staged_images(lesson: Lesson, staged_images: list, field: str) -> LessonGallery:
+    """
+    Appends staged images to the gallery of the lesson. The lesson row is locked so
+    only one request creates the gallery, and the gallery row because the upload
+    workers lock it as well before swapping the staged urls for the Drive ones:
+    an append never writes back urls read before a swap.
+    """
+    with transaction.atomic():
+        Lesson.objects.select_for_update().get(pk=lesson.pk)
+        gallery = LessonGallery.objects.select_for_update().filter(lesson=lesson, deleted_at__isnull=True).first()
+
+        if gallery is None:
+            gallery = LessonGallery(lesson=lesson, image_urls=[], image_variants={})
+
+        if gallery.images_count + len(staged_images) > LessonGallery.MAX_IMAGES:
+            raise serializers.ValidationError({field: _images_limit_message(gallery)})
+
+        for staged in staged_images:
+            gallery.image_urls.append(staged.url)
+            gallery.image_variants.update(get_image_variants(staged))
+
+        gallery.save()
+
+        for staged in staged_images:
+            schedule_drive_upload(staged, gallery, 'image_urls')
+
+    return gallery
+
 class CreateLessonGallerySerializer(serializers.ModelSerializer):
     image = serializers.ImageField(write_only=True)
     lesson = serializers.PrimaryKeyRelatedField(
@@ -23,23 +61,44 @@ class CreateLessonGallerySerializer(serializers.ModelSerializer):
         lesson = validated_data.pop('lesson')
         
         try:
-            image_url = upload_image_to_drive(image)
-            
-            if LessonGallery.objects.filter(
-                lesson=lesson,
-                deleted_at__isnull=True
-            ).exists():
-                gallery = LessonGallery.objects.get(
-                    lesson=lesson,
-                    deleted_at__isnull=True
-                )
-                gallery.image_urls.append(image_url)
-                gallery.save()
-                return gallery
-            
-            return LessonGallery.objects.create(
-                lesson=lesson,
-                image_urls=[image_url]
-            )
+            staged = stage_image(image)
         except Exception as e:
-            raise serializers.ValidationError({'image': str(e)}) 
\ No newline at end of file
+            raise serializers.ValidationError({'image': str(e)})
+
+        try:
+            return _append_staged_images(lesson, [staged], 'image')
+        except Exception:
+            discard_staged(staged)
+            raise
+
+class CreateLessonGalleryBatchSerializer(serializers.Serializer):
+    lesson = serializers.PrimaryKeyRelatedField(
+        queryset=Lesson.objects.filter(deleted_at__isnull=True)
+    )
+    images = serializers.ListField(
+        child=serializers.ImageField(),
+        min_length=1,
+        max_length=LessonGallery.MAX_IMAGES,
+        write_only=True
+    )
+
+    def validate(self, data):
+        data = super().validate(data)
+
+        gallery = LessonGallery.objects.filter(lesson=data['lesson'], deleted_at__isnull=True).first()
+
+        if gallery and gallery.images_count + len(data['images']) > LessonGallery.MAX_IMAGES:
+            raise serializers.ValidationError({'images': _images_limit_message(gallery)})
+
+        return data
+
+    def create(self, validated_data):
+        lesson = validated_data['lesson']
+        staged_images = stage_images(validated_data['images'])
+
+        try:
+            return _append_staged_images(lesson, staged_images, 'images')
+        except Exception:
+            for staged in staged_images:
+                discard_staged(staged)
+            raise
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from steam_api.models.lesson_replacement import LessonReplacement
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class LessonReplacementSerializer(serializers.ModelSerializer):
+class LessonReplacementSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = LessonReplacement
         fields = "__all__"
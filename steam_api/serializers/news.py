@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from steam_api.models.news import News
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = News
         fields = "__all__"
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from steam_api.models.student import Student
-from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.upload_pipeline import stage_image, get_image_variants, schedule_drive_upload
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         fields = "__all__"
@@ -26,14 +27,22 @@ class CreateStudentSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         avatar = validated_data.pop('avatar', None)
         
+        staged = None
+        
         if avatar:
             try:
-                avatar_url = upload_image_to_drive(avatar)
-                validated_data['avatar_url'] = avatar_url
+                staged = stage_image(avatar)
+                validated_data['avatar_url'] = staged.url
+                validated_data['image_variants'] = get_image_variants(staged)
             except Exception as e:
                 raise serializers.ValidationError({'avatar': str(e)})
                 
-        return super().create(validated_data)
+        instance = super().create(validated_data)
+
+        if staged:
+            schedule_drive_upload(staged, instance, 'avatar_url')
+
+        return instance
 
 class UpdateStudentSerializer(serializers.ModelSerializer):
     avatar = serializers.ImageField(write_only=True, required=False)
@@ -58,11 +67,19 @@ class UpdateStudentSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         avatar = validated_data.pop('avatar', None)
         
+        staged = None
+        
         if avatar:
             try:
-                avatar_url = upload_image_to_drive(avatar)
-                validated_data['avatar_url'] = avatar_url
+                staged = stage_image(avatar)
+                validated_data['avatar_url'] = staged.url
+                validated_data['image_variants'] = get_image_variants(staged)
             except Exception as e:
                 raise serializers.ValidationError({'avatar': str(e)})
                 
-        return super().update(instance, validated_data) 
\ No newline at end of file
+        instance = super().update(instance, validated_data)
+
+        if staged:
+            schedule_drive_upload(staged, instance, 'avatar_url')
+
+        return instance 
\ No newline at end of file
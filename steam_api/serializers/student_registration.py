@@ -3,8 +3,9 @@ from steam_api.models.student import Student
 from steam_api.models.student_registration import StudentRegistration
 from steam_api.serializers.app_user import AppUserSerializer
 from steam_api.serializers.student import StudentSerializer
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class StudentRegistrationSerializer(serializers.ModelSerializer):
+class StudentRegistrationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     app_user = AppUserSerializer(read_only=True)
     student = serializers.SerializerMethodField()
 
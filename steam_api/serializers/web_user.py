@@ -1,22 +1,13 @@
 import re
 from rest_framework import serializers
 from steam_api.models.web_user import WebUser, WebUserRole, WebUserStatus, WebUserGender
+from steam_api.helpers.sparse_fields import SparseFieldsMixin
 
-class WebUserSerializer(serializers.ModelSerializer):
+class WebUserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta: 
         model = WebUser
         fields = "__all__"
 
-    def __init__(self, *args, **kwargs):
-        existing = set(self.fields.keys())
-        fields = kwargs.pop("fields", []) or existing
-        exclude = kwargs.pop("exclude", [])
-        
-        super().__init__(*args, **kwargs)
-        
-        for field in exclude + list(set(existing) - set(fields)):
-            self.fields.pop(field, None)
-
 class CreateWebUserSerializer(serializers.Serializer):
     name = serializers.CharField(required=True)
     email = serializers.EmailField(required=True)
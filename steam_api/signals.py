@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from steam_api.helpers import response_cache
+from steam_api.models.course import Course
+from steam_api.models.news import News
+from steam_api.models.facility import Facility
+from steam_api.models.facility_image import FacilityImage
+
+# Cached response namespaces each model's changes make stale (soft deletes are saves)
+RESPONSE_CACHE_NAMESPACES = {
+    Course: "courses",
+    News: "news",
+    Facility: "facilities",
+    FacilityImage: "facilities",
+}
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_response_cache(sender, **kwargs):
+    namespace = RESPONSE_CACHE_NAMESPACES.get(sender)
+
+    if namespace is not None:
+        response_cache.invalidate(namespace)
@@ -1,10 +1,14 @@
 import logging
 from rest_framework import viewsets, status
+from rest_framework.renderers import BrowsableAPIRenderer
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.renderers import FastJSONRenderer
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
@@ -13,9 +17,12 @@ from steam_api.serializers.attendance import AttendanceSerializer
 
 class AppAttendanceView(viewsets.ViewSet):
     authentication_classes = (AppAuthentication,)
+    renderer_classes = (FastJSONRenderer, BrowsableAPIRenderer)
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -66,7 +73,8 @@ class AppAttendanceView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Attendance, ordering=['-check_in_time', 'lesson__module__class_room__name', 'lesson__module__sequence_number', 'lesson__sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppAttendanceView.list user=%s, params=%s", request.user.id, request.query_params)
             
@@ -123,8 +131,10 @@ class AppAttendanceView(viewsets.ViewSet):
                 'lesson__sequence_number'
             )
 
-            serializer = AttendanceSerializer(attendances, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            attendances = paginator.paginate(attendances)
+
+            serializer = AttendanceSerializer(attendances, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppAttendanceView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
@@ -6,8 +6,8 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 
-from steam_api.const.const import ZALO_USER_INFO_API
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.zalo_client import get_zalo_client
 from steam_api.models.app_user import AppUser
 from steam_api.serializers.app_user import CreateAppSessionSerializer
 
@@ -27,15 +27,11 @@ class AppAuthView(viewsets.ViewSet):
             _data = validate.validated_data
             access_token = _data["token"]
 
-            resp = requests.get(
-                url=ZALO_USER_INFO_API,
-                headers={
-                    "access_token": access_token
-                }
-            )
-            logging.getLogger().info("AppAuthView.register_session get zalo user info resp=%s", resp.text)
-
-            resp_data = resp.json()
+            try:
+                resp_data = get_zalo_client().get_profile(access_token)
+            except requests.RequestException as e:
+                logging.getLogger().exception("AppAuthView.register_session get zalo user info exc=%s", e)
+                return RestResponse(status=status.HTTP_503_SERVICE_UNAVAILABLE, message="Đã xảy ra lỗi khi chúng tôi cố gắng kiểm tra tài khoản của bạn!").response
 
             logging.getLogger().info("AppAuthView.register_session get zalo user info resp_data=%s", resp_data)
 
@@ -47,10 +43,12 @@ class AppAuthView(viewsets.ViewSet):
             user_avatar_url = resp_data.get("picture", {}).get("data", {}).get("url", "")
             user_phone_number = resp_data.get("phone", {}).get("data", {}).get("value", "")
 
-            if not self.__create_app_user(user_id, user_name, user_avatar_url, user_phone_number):
+            user = self.__create_app_user(user_id, user_name, user_avatar_url, user_phone_number)
+
+            if user is None:
                 return RestResponse(status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
             
-            self.__create_access_token(user_id, access_token)
+            self.__create_access_token(user, access_token)
 
             return RestResponse(status=status.HTTP_200_OK, data=resp_data).response
         except Exception as e:
@@ -61,7 +59,7 @@ class AppAuthView(viewsets.ViewSet):
         try:
             try:
                 user = AppUser.objects.get(app_user_id=user_id)
-                return True
+                return user
             except AppUser.DoesNotExist:
                 logging.getLogger().info("AppAuthView.__create_app_user DoesNotExist user_id=%s", user_id)
             
@@ -75,19 +73,19 @@ class AppAuthView(viewsets.ViewSet):
 
             if user.id is None:
                 logging.getLogger().error("AppAuthView.__create_app_user create user failed user=%s", user)
-                return False
+                return None
 
-            return True
+            return user
         except Exception as e:
             logging.getLogger().error("AppAuthView.__create_app_user exc=%s, user=%s", e, user)
-            return False
+            return None
         
-    def __create_access_token(self, app_user_id, mini_app_token):
+    def __create_access_token(self, user: AppUser, mini_app_token):
         cache.delete(f"app_session:access:*")
 
         cache.set(
             f"app_session:access:{mini_app_token}", 
-            {"user_id": app_user_id},
+            {"user_id": user.app_user_id},
             7*24*60*60
         )
         
\ No newline at end of file
@@ -5,17 +5,21 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.class_room import ClassRoom
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
-from steam_api.serializers.class_room import ClassRoomSerializer
+from steam_api.serializers.class_room import ClassRoomSerializer, class_room_queryset
 
 class AppClassRoomView(viewsets.ViewSet):
     authentication_classes = (AppAuthentication,)
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -37,7 +41,8 @@ class AppClassRoomView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(ClassRoom, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppClassRoomView.list user=%s, params=%s", request.user.id, request.query_params)
             
@@ -66,10 +71,12 @@ class AppClassRoomView(viewsets.ViewSet):
                 'class_room__course'
             ).values_list('class_room', flat=True).distinct()
             
-            class_rooms = ClassRoom.objects.filter(id__in=class_rooms)
+            class_rooms = class_room_queryset().filter(id__in=class_rooms)
             
-            serializer = ClassRoomSerializer(class_rooms, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            class_rooms = paginator.paginate(class_rooms)
+
+            serializer = ClassRoomSerializer(class_rooms, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppClassRoomView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
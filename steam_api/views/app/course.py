@@ -4,6 +4,10 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.helpers.response_cache import cached_response
 from steam_api.models.course import Course
 from steam_api.models.student import Student
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
@@ -15,6 +19,8 @@ class AppCourseView(viewsets.ViewSet):
     
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -36,7 +42,9 @@ class AppCourseView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @cached_response("courses", bypass_params=('student',))
+    @keyset_paginated(Course, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppCourseView.list")
             student_id = request.query_params.get('student', None)
@@ -66,8 +74,14 @@ class AppCourseView(viewsets.ViewSet):
                 except Student.DoesNotExist:
                     return RestResponse(message="Không tìm thấy thông tin học viên!", status=status.HTTP_404_NOT_FOUND).response
 
-            serializer = CourseSerializer(courses, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            validators = ResponseValidators.for_queryset(request, courses)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            courses = paginator.paginate(courses)
+
+            serializer = CourseSerializer(courses, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination, validators=validators).response
         except Exception as e:
             logging.getLogger().exception("AppCourseView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
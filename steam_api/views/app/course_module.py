@@ -5,6 +5,8 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
@@ -16,6 +18,8 @@ class AppCourseModuleView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -44,7 +48,8 @@ class AppCourseModuleView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(CourseModule, ordering=['class_room__name', 'sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppCourseModuleView.list user=%s, params=%s", request.user.id, request.query_params)
             
@@ -82,8 +87,10 @@ class AppCourseModuleView(viewsets.ViewSet):
                 'class_room__course'
             ).order_by('class_room__name', 'sequence_number')
 
-            serializer = CourseModuleSerializer(modules, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            modules = paginator.paginate(modules)
+
+            serializer = CourseModuleSerializer(modules, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppCourseModuleView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
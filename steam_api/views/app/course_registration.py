@@ -5,6 +5,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.models.course_registration import CourseRegistration
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.serializers.course_registration import (
@@ -18,6 +20,8 @@ class AppCourseRegistrationView(viewsets.ViewSet):
     
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -54,7 +58,8 @@ class AppCourseRegistrationView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(CourseRegistration, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppCourseRegistrationView.list params=%s", request.query_params)
             student_id = request.query_params.get('student')
@@ -80,8 +85,10 @@ class AppCourseRegistrationView(viewsets.ViewSet):
                 
             registrations = registrations.order_by('-created_at')
                 
-            serializer = CourseRegistrationSerializer(registrations, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            registrations = paginator.paginate(registrations)
+
+            serializer = CourseRegistrationSerializer(registrations, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppCourseRegistrationView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
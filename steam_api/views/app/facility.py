@@ -5,6 +5,10 @@ from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import KeysetPaginator, keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.helpers.response_cache import cached_response
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.facility import Facility
 from steam_api.serializers.facility import FacilitySerializer
@@ -16,22 +20,32 @@ class AppFacilityView(viewsets.ViewSet):
     authentication_classes = (AppAuthentication, )
     
     @swagger_auto_schema(
+        manual_parameters=[*PAGINATION_PARAMETERS, *SPARSE_FIELDS_PARAMETERS],
         operation_description="Get list of facilities for app",
         responses={
             200: FacilitySerializer(many=True),
             500: "Internal Server Error"
         }
     )
-    def list(self, request: Request) -> Response:
+    @cached_response("facilities")
+    @keyset_paginated(Facility, ordering=['-created_at'])
+    def list(self, request: Request, paginator: KeysetPaginator) -> Response:
         try:
             queryset = Facility.get_active_facilities().order_by('-created_at')
-            data = FacilitySerializer(queryset, many=True).data
+            validators = ResponseValidators.for_queryset(request, queryset, related=('images',))
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            queryset = paginator.paginate(queryset)
+
+            data = FacilitySerializer(queryset, many=True, context={'request': request}).data
 
             return RestResponse(
                 data=data,
-                status=status.HTTP_200_OK
+                status=status.HTTP_200_OK,
+                pagination=paginator.pagination,
+                validators=validators
             ).response
-            
         except Exception as e:
             logger.exception("AppFacilityView.list exc=%s", e)
             return RestResponse(
@@ -5,6 +5,8 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
@@ -16,6 +18,8 @@ class AppLessonView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -51,7 +55,8 @@ class AppLessonView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Lesson, ordering=['module__class_room__name', 'module__sequence_number', 'sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppLessonView.list user=%s, params=%s", request.user.id, request.query_params)
             
@@ -90,21 +95,25 @@ class AppLessonView(viewsets.ViewSet):
             lessons = lessons.select_related(
                 'module',
                 'module__class_room',
-                'module__class_room__course'
+                'module__class_room__course',
+                'occurrence'
             ).order_by(
                 'module__class_room__name',
                 'module__sequence_number',
                 'sequence_number'
             )
 
+            lessons = paginator.paginate(lessons)
+
             serializer = LessonSerializer(
                 lessons, 
                 many=True,
                 context={
+                    'request': request,
                     **({'student_id': student_id} if student_id else {})
                 }
             )
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppLessonView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
@@ -4,6 +4,9 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.lesson_documentation import LessonDocumentation
 from steam_api.serializers.lesson_documentation import LessonDocumentationSerializer
@@ -16,6 +19,8 @@ class AppLessonDocumentationView(viewsets.ViewSet):
             200: LessonDocumentationSerializer(many=True)
         },
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'lesson',
                 openapi.IN_QUERY,
@@ -25,15 +30,22 @@ class AppLessonDocumentationView(viewsets.ViewSet):
             )
         ],
     )
-    def list(self, request):
+    @keyset_paginated(LessonDocumentation, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppLessonDocumentationView.list req=%s", request.query_params)
             lesson_documentations = LessonDocumentation.objects.filter(deleted_at__isnull=True)
             lesson_param = request.query_params.get('lesson')
             if lesson_param:
                 lesson_documentations = lesson_documentations.filter(lesson=lesson_param)
-            serializer = LessonDocumentationSerializer(lesson_documentations, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            validators = ResponseValidators.for_queryset(request, lesson_documentations)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            lesson_documentations = paginator.paginate(lesson_documentations)
+
+            serializer = LessonDocumentationSerializer(lesson_documentations, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination, validators=validators).response
         except Exception as e:
             logging.getLogger().exception("AppLessonDocumentationView.list exc=%s, req=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
\ No newline at end of file
@@ -5,6 +5,9 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
@@ -16,6 +19,8 @@ class AppLessonGalleryView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -58,7 +63,8 @@ class AppLessonGalleryView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(LessonGallery, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppLessonGalleryView.list user=%s, params=%s", request.user.id, request.query_params)
             
@@ -109,8 +115,14 @@ class AppLessonGalleryView(viewsets.ViewSet):
                 'lesson__sequence_number'
             )
 
-            serializer = LessonGallerySerializer(galleries, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            validators = ResponseValidators.for_queryset(request, galleries)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            galleries = paginator.paginate(galleries)
+
+            serializer = LessonGallerySerializer(galleries, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination, validators=validators).response
         except Exception as e:
             logging.getLogger().exception("AppLessonGalleryView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
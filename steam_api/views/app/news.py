@@ -3,6 +3,10 @@ from steam_api.models.news import News
 from steam_api.serializers.news import NewsSerializer
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.helpers.response_cache import cached_response
 from drf_yasg.utils import swagger_auto_schema
 import logging
 
@@ -10,15 +14,24 @@ class AppNewsView(viewsets.ViewSet):
     authentication_classes = (AppAuthentication,)
 
     @swagger_auto_schema(
+        manual_parameters=[*PAGINATION_PARAMETERS, *SPARSE_FIELDS_PARAMETERS],
         operation_description="Get all news",
         responses={200: NewsSerializer(many=True)}
     )
-    def list(self, request):
+    @cached_response("news")
+    @keyset_paginated(News, ordering=['-posted_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppNewsView.list params=%s", request.query_params)
             news = News.objects.filter(deleted_at__isnull=True).order_by('-posted_at')
-            serializer = NewsSerializer(news, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            validators = ResponseValidators.for_queryset(request, news)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            news = paginator.paginate(news)
+
+            serializer = NewsSerializer(news, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination, validators=validators).response
         except Exception as e:
             logging.getLogger().exception("AppNewsView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
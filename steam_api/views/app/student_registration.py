@@ -4,6 +4,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.student import Student
@@ -16,6 +18,8 @@ class AppStudentRegistrationView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'status',
                 openapi.IN_QUERY,
@@ -38,7 +42,8 @@ class AppStudentRegistrationView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(StudentRegistration, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("AppStudentRegistrationView.list params=%s", request.query_params)
             
@@ -54,8 +59,10 @@ class AppStudentRegistrationView(viewsets.ViewSet):
             
             requests = requests.order_by('-created_at')
             
-            serializer = StudentRegistrationSerializer(requests, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            requests = paginator.paginate(requests)
+
+            serializer = StudentRegistrationSerializer(requests, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("AppStudentRegistrationView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -4,9 +4,13 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.app_authentication import AppAuthentication
 from steam_api.models.class_room import ClassRoom
 from steam_api.models.lesson import Lesson
+from steam_api.models.lesson_occurrence import LessonOccurrence
 from steam_api.models.student import Student
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
 from steam_api.models.course_registration import CourseRegistration
@@ -17,6 +21,8 @@ class AppTimeTableView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'student',
                 openapi.IN_QUERY,
@@ -33,7 +39,8 @@ class AppTimeTableView(viewsets.ViewSet):
             )
         ]
     )   
-    def list(self, request):
+    @keyset_paginated(Lesson, ordering=['module__sequence_number', 'sequence_number'])
+    def list(self, request, paginator):
         try:
             student_id = request.query_params.get('student', None)
             class_room_id = request.query_params.get('class_room', None)
@@ -50,9 +57,24 @@ class AppTimeTableView(viewsets.ViewSet):
             if not CourseRegistration.objects.filter(student=student, class_room=class_room, status="approved", deleted_at__isnull=True).exists():
                 return RestResponse(message="Học viên này không đăng ký khóa học này!", status=status.HTTP_403_FORBIDDEN).response
             
-            lessons = Lesson.objects.filter(module__class_room=class_room).order_by("module__sequence_number", "sequence_number")
+            lessons = Lesson.objects.filter(module__class_room=class_room, deleted_at__isnull=True).select_related(
+                'module',
+                'module__class_room',
+                'occurrence'
+            ).order_by("module__sequence_number", "sequence_number")
             
-            return RestResponse(data=LessonSerializer(lessons, many=True).data, status=status.HTTP_200_OK).response
+            validators = ResponseValidators.for_queryset(
+                request,
+                lessons,
+                related=('module', 'module__class_room', 'occurrence'),
+                extra=LessonOccurrence.status_aggregates(prefix='occurrence__', class_room_prefix='module__class_room__')
+            )
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            lessons = paginator.paginate(lessons)
+
+            return RestResponse(data=LessonSerializer(lessons, many=True, context={'request': request}).data, status=status.HTTP_200_OK, pagination=paginator.pagination, validators=validators).response
 
         except Student.DoesNotExist:
             return RestResponse(message="Không tìm thấy thông tin học viên!", status=status.HTTP_404_NOT_FOUND).response
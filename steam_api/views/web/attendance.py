@@ -1,57 +1,80 @@
 import logging
 from rest_framework import viewsets, status
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.db import IntegrityError
 from django.db.models import Q
 
 from steam_api import models
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.renderers import FastJSONRenderer
+from steam_api.helpers.csv_export import stream_csv, student_columns, lesson_columns
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.models.attendance import Attendance
 from steam_api.models.course_registration import CourseRegistration
 from steam_api.models.lesson_checkin import LessonCheckin
 from steam_api.models.web_user import WebUserRole
-from steam_api.serializers.attendance import AttendanceSerializer, CreateAttendanceSerializer
+from steam_api.serializers.attendance import AttendanceSerializer, CreateAttendanceSerializer, CreateBulkAttendanceSerializer
 from steam_api.middlewares.permissions import IsNotRoot, IsTeacher
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 
+ATTENDANCE_EXPORT_COLUMNS = [
+    ('id', 'id'),
+    *student_columns(),
+    *lesson_columns(),
+    ('status', 'status'),
+    ('check_in_time', 'check_in_time'),
+    ('note', 'note'),
+]
+
+ATTENDANCE_FILTER_PARAMETERS = [
+    openapi.Parameter(
+        'student',
+        openapi.IN_QUERY,
+        description='Filter by student ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'classroom',
+        openapi.IN_QUERY,
+        description='Filter by classroom ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'module',
+        openapi.IN_QUERY,
+        description='Filter by module ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'lesson',
+        openapi.IN_QUERY,
+        description='Filter by lesson ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    )
+]
+
 class WebAttendanceView(viewsets.ViewSet):
     authentication_classes = (WebUserAuthentication,)
+    renderer_classes = (FastJSONRenderer, BrowsableAPIRenderer)
 
     def get_permissions(self):
-        if self.action in ['create']:
+        if self.action in ['create', 'bulk_create']:
             return [IsTeacher()]
         return [IsNotRoot()]
 
     @swagger_auto_schema(
         manual_parameters=[
-            openapi.Parameter(
-                'student',
-                openapi.IN_QUERY,
-                description='Filter by student ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'classroom',
-                openapi.IN_QUERY,
-                description='Filter by classroom ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'module',
-                openapi.IN_QUERY,
-                description='Filter by module ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'lesson',
-                openapi.IN_QUERY,
-                description='Filter by lesson ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            )
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
+            *ATTENDANCE_FILTER_PARAMETERS
         ],
         responses={
             200: AttendanceSerializer(many=True),
@@ -66,42 +89,63 @@ class WebAttendanceView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Attendance, ordering=['-check_in_time'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebAttendanceView.list params=%s", request.query_params)
-            
-            student_id = request.query_params.get('student')
-            classroom_id = request.query_params.get('classroom')
-            module_id = request.query_params.get('module')
-            lesson_id = request.query_params.get('lesson')
-            attendances = Attendance.objects.filter(deleted_at__isnull=True)
-            
-            if request.user.role == WebUserRole.TEACHER:
-                attendances = attendances.filter(
-                    Q(lesson__module__class_room__teacher=request.user) |
-                    Q(lesson__module__class_room__teaching_assistant=request.user)
-                )
-
-            if student_id:
-                attendances = attendances.filter(student_id=student_id)
+            attendances = self.__filter_attendances(request).select_related('student', 'lesson').order_by('-check_in_time')
                 
-            if classroom_id:
-                attendances = attendances.filter(lesson__module__class_room_id=classroom_id)
-                
-            if module_id:
-                attendances = attendances.filter(lesson__module_id=module_id)
-                
-            if lesson_id:
-                attendances = attendances.filter(lesson_id=lesson_id)
-                
-            attendances = attendances.select_related('student', 'lesson').order_by('-check_in_time')
-                
-            serializer = AttendanceSerializer(attendances, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            attendances = paginator.paginate(attendances)
+
+            serializer = AttendanceSerializer(attendances, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebAttendanceView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
+    @swagger_auto_schema(
+        manual_parameters=ATTENDANCE_FILTER_PARAMETERS,
+        responses={
+            200: 'CSV file',
+            500: 'Internal Server Error'
+        }
+    )
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        try:
+            logging.getLogger().info("WebAttendanceView.export params=%s", request.query_params)
+            return stream_csv("attendances.csv", self.__filter_attendances(request), ATTENDANCE_EXPORT_COLUMNS)
+        except Exception as e:
+            logging.getLogger().exception("WebAttendanceView.export exc=%s", e)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
+    def __filter_attendances(self, request):
+        student_id = request.query_params.get('student')
+        classroom_id = request.query_params.get('classroom')
+        module_id = request.query_params.get('module')
+        lesson_id = request.query_params.get('lesson')
+        attendances = Attendance.objects.filter(deleted_at__isnull=True)
+        
+        if request.user.role == WebUserRole.TEACHER:
+            attendances = attendances.filter(
+                Q(lesson__module__class_room__teacher=request.user) |
+                Q(lesson__module__class_room__teaching_assistant=request.user)
+            )
+
+        if student_id:
+            attendances = attendances.filter(student_id=student_id)
+            
+        if classroom_id:
+            attendances = attendances.filter(lesson__module__class_room_id=classroom_id)
+            
+        if module_id:
+            attendances = attendances.filter(lesson__module_id=module_id)
+            
+        if lesson_id:
+            attendances = attendances.filter(lesson_id=lesson_id)
+
+        return attendances
+
     @swagger_auto_schema(
         request_body=CreateAttendanceSerializer,
         responses={
@@ -185,4 +229,87 @@ class WebAttendanceView(viewsets.ViewSet):
             return RestResponse(data=AttendanceSerializer(attendance).data, status=status.HTTP_201_CREATED).response
         except Exception as e:
             logging.getLogger().exception("WebAttendanceView.create exc=%s", e)
-            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
\ No newline at end of file
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
+    @swagger_auto_schema(
+        operation_description="Take attendance of several students of a lesson at once. Students who already have an attendance for the lesson get the fields sent updated.",
+        request_body=CreateBulkAttendanceSerializer,
+        responses={
+            201: AttendanceSerializer(many=True),
+            400: openapi.Response(
+                description='Bad Request',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_OBJECT)
+                    }
+                )
+            ),
+            409: 'Conflict - The attendance of the lesson is being written by another request',
+            500: openapi.Response(
+                description='Internal Server Error',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
+                )
+            )
+        }
+    )
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        try:
+            logging.getLogger().info("WebAttendanceView.bulk_create req=%s", request.data)
+            
+            serializer = CreateBulkAttendanceSerializer(data=request.data)
+            if not serializer.is_valid():
+                return RestResponse(data={"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST).response
+            
+            lesson = serializer.validated_data['lesson']
+            class_room = lesson.module.class_room
+            
+            if class_room.teacher != request.user and class_room.teaching_assistant != request.user:
+                return RestResponse(
+                    status=status.HTTP_403_FORBIDDEN,
+                    message="Bạn không có quyền điểm danh buổi học này!"   
+                ).response
+            
+            if lesson.status == 'not_started':
+                return RestResponse(
+                    status=status.HTTP_403_FORBIDDEN,
+                    message="Buổi học này chưa bắt đầu!"
+                ).response
+            
+            if not LessonCheckin.objects.filter(lesson=lesson, deleted_at__isnull=True).exists():
+                return RestResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    message="Giáo viên hoặc trợ giảng chưa checkin buổi học này!"
+                ).response
+            
+            approved_student_ids = set(CourseRegistration.objects.filter(
+                class_room=class_room,
+                status='approved',
+                deleted_at__isnull=True
+            ).values_list('student_id', flat=True))
+            
+            errors = [
+                {} if item['student'] in approved_student_ids
+                else {"student": ["Học viên chưa đăng ký lớp này hoặc đăng ký chưa được phê duyệt!"]}
+                for item in serializer.validated_data['attendances']
+            ]
+            
+            if any(errors):
+                return RestResponse(data={"error": {"attendances": errors}}, status=status.HTTP_400_BAD_REQUEST).response
+            
+            attendances = serializer.save()
+            return RestResponse(data=AttendanceSerializer(attendances, many=True).data, status=status.HTTP_201_CREATED).response
+        except IntegrityError as e:
+            logging.getLogger().info("WebAttendanceView.bulk_create conflict exc=%s", e)
+            return RestResponse(
+                status=status.HTTP_409_CONFLICT,
+                message="Buổi học này đang được điểm danh bởi yêu cầu khác, vui lòng thử lại!"
+            ).response
+        except Exception as e:
+            logging.getLogger().exception("WebAttendanceView.bulk_create exc=%s", e)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -8,12 +8,16 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.upload_pipeline import stage_image, get_image_variants, schedule_drive_upload
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.models.class_room import ClassRoom
 from steam_api.models.web_user import WebUserRole
 from steam_api.serializers.class_room import (
     ClassRoomSerializer,
     CreateClassRoomSerializer,
+    class_room_queryset,
     UpdateClassRoomSerializer
 )
 from steam_api.middlewares.web_authentication import WebUserAuthentication
@@ -28,6 +32,8 @@ class WebClassRoomView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'course_id',
                 openapi.IN_QUERY,
@@ -56,13 +62,14 @@ class WebClassRoomView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(ClassRoom, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebClassRoomView.list params=%s", request.query_params)
             course_id = request.query_params.get('course_id')
             teacher_id = request.query_params.get('teacher')
             
-            classes = ClassRoom.objects.filter(is_active=True, deleted_at__isnull=True)
+            classes = class_room_queryset().filter(is_active=True, deleted_at__isnull=True)
             
             if course_id:
                 classes = classes.filter(course_id=course_id)
@@ -76,13 +83,16 @@ class WebClassRoomView(viewsets.ViewSet):
             if request.user.role == WebUserRole.TEACHER:
                 classes = classes.filter(teacher=request.user) | classes.filter(teaching_assistant=request.user)
                 
-            serializer = ClassRoomSerializer(classes, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            classes = paginator.paginate(classes)
+
+            serializer = ClassRoomSerializer(classes, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebClassRoomView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
     @swagger_auto_schema(
+        manual_parameters=SPARSE_FIELDS_PARAMETERS,
         responses={
             200: ClassRoomSerializer(),
             404: 'Not Found',
@@ -109,7 +119,7 @@ class WebClassRoomView(viewsets.ViewSet):
                 if class_room.teacher != request.user and class_room.teaching_assistant != request.user:
                     return RestResponse(status=status.HTTP_403_FORBIDDEN).response
 
-            serializer = ClassRoomSerializer(class_room)
+            serializer = ClassRoomSerializer(class_room, context={'request': request})
             return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
         except Exception as e:
             logging.getLogger().exception("WebClassRoomView.retrieve exc=%s, pk=%s", e, pk)
@@ -303,8 +313,11 @@ class WebClassRoomView(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 ).response
 
-            class_room.thumbnail = request.FILES['thumbnail']
-            class_room.save(update_fields=['thumbnail'])
+            staged = stage_image(request.FILES['thumbnail'])
+            class_room.thumbnail_url = staged.url
+            class_room.image_variants = get_image_variants(staged)
+            class_room.save(update_fields=['thumbnail_url', 'image_variants', 'updated_at'])
+            schedule_drive_upload(staged, class_room, 'thumbnail_url')
             
             serializer = ClassRoomSerializer(class_room)
             return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
@@ -7,6 +7,9 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.models.course import Course
 from steam_api.models.web_user import WebUserRole
@@ -23,6 +26,7 @@ class WebCourseView(viewsets.ViewSet):
         return [IsNotRoot()]
 
     @swagger_auto_schema(
+        manual_parameters=[*PAGINATION_PARAMETERS, *SPARSE_FIELDS_PARAMETERS],
         responses={
             200: CourseSerializer(many=True),
             500: openapi.Response(
@@ -36,18 +40,22 @@ class WebCourseView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Course, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebCourseView.list params=%s", request.query_params)
             courses = Course.objects.filter(is_active=True, deleted_at__isnull=True)
 
-            serializer = CourseSerializer(courses, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            courses = paginator.paginate(courses)
+
+            serializer = CourseSerializer(courses, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebCourseView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
     @swagger_auto_schema(
+        manual_parameters=SPARSE_FIELDS_PARAMETERS,
         responses={
             200: CourseSerializer(),
             404: 'Not Found',
@@ -65,13 +73,19 @@ class WebCourseView(viewsets.ViewSet):
     def retrieve(self, request, pk=None):
         try:
             logging.getLogger().info("WebCourseView.retrieve pk=%s", pk)
+            courses = Course.objects.filter(pk=pk, is_active=True, deleted_at__isnull=True)
+
+            validators = ResponseValidators.for_queryset(request, courses)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
             try:
-                course = Course.objects.get(pk=pk, is_active=True, deleted_at__isnull=True)
+                course = courses.get()
             except Course.DoesNotExist:
                 return RestResponse(status=status.HTTP_404_NOT_FOUND).response
 
-            serializer = CourseSerializer(course)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            serializer = CourseSerializer(course, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, validators=validators).response
         except Exception as e:
             logging.getLogger().exception("WebCourseView.retrieve exc=%s, pk=%s", e, pk)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -6,6 +6,8 @@ from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.models.course_module import CourseModule
 from steam_api.models.web_user import WebUserRole
@@ -26,6 +28,8 @@ class WebCourseModuleView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'class_room',
                 openapi.IN_QUERY,
@@ -54,7 +58,8 @@ class WebCourseModuleView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(CourseModule, ordering=['sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebCourseModuleView.list params=%s", request.query_params)
             class_room_id = request.query_params.get('class_room')
@@ -79,8 +84,10 @@ class WebCourseModuleView(viewsets.ViewSet):
                 
             modules = modules.order_by('sequence_number')
                 
-            serializer = CourseModuleSerializer(modules, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            modules = paginator.paginate(modules)
+
+            serializer = CourseModuleSerializer(modules, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebCourseModuleView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
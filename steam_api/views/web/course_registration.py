@@ -1,10 +1,15 @@
 import logging
 from django.utils import timezone
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.csv_export import stream_csv, student_columns
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.errors.class_room_full_exception import ClassRoomFullException
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.models.course_registration import CourseRegistration
 from steam_api.models.web_user import WebUserRole
@@ -15,6 +20,47 @@ from steam_api.serializers.course_registration import (
 )
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 
+REGISTRATION_EXPORT_COLUMNS = [
+    ('id', 'id'),
+    *student_columns(),
+    ('contact_for_anonymous', 'contact_for_anonymous'),
+    ('class_room_id', 'class_room_id'),
+    ('class_room_name', 'class_room__name'),
+    ('course_name', 'class_room__course__name'),
+    ('status', 'status'),
+    ('amount', 'amount'),
+    ('paid_amount', 'paid_amount'),
+    ('payment_method', 'payment_method'),
+    ('payment_status', 'payment_status'),
+    ('note', 'note'),
+    ('created_at', 'created_at'),
+]
+
+REGISTRATION_FILTER_PARAMETERS = [
+    openapi.Parameter(
+        'student',
+        openapi.IN_QUERY,
+        description='Filter by student ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'class_room',
+        openapi.IN_QUERY,
+        description='Filter by class room ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'status',
+        openapi.IN_QUERY,
+        description='Filter by registration status',
+        type=openapi.TYPE_STRING,
+        enum=['pending', 'approved', 'rejected', 'cancelled'],
+        required=False
+    )
+]
+
 class WebCourseRegistrationView(viewsets.ViewSet):
     authentication_classes = (WebUserAuthentication,)
     
@@ -23,28 +69,9 @@ class WebCourseRegistrationView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
-            openapi.Parameter(
-                'student',
-                openapi.IN_QUERY,
-                description='Filter by student ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'class_room',
-                openapi.IN_QUERY,
-                description='Filter by class room ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'status',
-                openapi.IN_QUERY,
-                description='Filter by registration status',
-                type=openapi.TYPE_STRING,
-                enum=['pending', 'approved', 'rejected', 'cancelled'],
-                required=False
-            )
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
+            *REGISTRATION_FILTER_PARAMETERS
         ],
         responses={
             200: CourseRegistrationSerializer(many=True),
@@ -59,32 +86,54 @@ class WebCourseRegistrationView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(CourseRegistration, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebCourseRegistrationView.list params=%s", request.query_params)
-            student_id = request.query_params.get('student')
-            class_room_id = request.query_params.get('class_room')
-            status_param = request.query_params.get('status')
-            
-            registrations = CourseRegistration.objects.filter(deleted_at__isnull=True)
-            
-            if student_id:
-                registrations = registrations.filter(student_id=student_id)
+            registrations = self.__filter_registrations(request).order_by('-created_at')
                 
-            if class_room_id:
-                registrations = registrations.filter(class_room_id=class_room_id)
-                
-            if status_param:
-                registrations = registrations.filter(status=status_param)
-                
-            registrations = registrations.order_by('-created_at')
-                
-            serializer = CourseRegistrationSerializer(registrations, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            registrations = paginator.paginate(registrations)
+
+            serializer = CourseRegistrationSerializer(registrations, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebCourseRegistrationView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
+    @swagger_auto_schema(
+        manual_parameters=REGISTRATION_FILTER_PARAMETERS,
+        responses={
+            200: 'CSV file',
+            500: 'Internal Server Error'
+        }
+    )
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        try:
+            logging.getLogger().info("WebCourseRegistrationView.export params=%s", request.query_params)
+            return stream_csv("course_registrations.csv", self.__filter_registrations(request), REGISTRATION_EXPORT_COLUMNS)
+        except Exception as e:
+            logging.getLogger().exception("WebCourseRegistrationView.export exc=%s, params=%s", e, request.query_params)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
+    def __filter_registrations(self, request):
+        student_id = request.query_params.get('student')
+        class_room_id = request.query_params.get('class_room')
+        status_param = request.query_params.get('status')
+        
+        registrations = CourseRegistration.objects.filter(deleted_at__isnull=True)
+        
+        if student_id:
+            registrations = registrations.filter(student_id=student_id)
+            
+        if class_room_id:
+            registrations = registrations.filter(class_room_id=class_room_id)
+            
+        if status_param:
+            registrations = registrations.filter(status=status_param)
+
+        return registrations
+
     @swagger_auto_schema(
         request_body=CreateCourseRegistrationSerializer,
         responses={
@@ -129,6 +178,11 @@ class WebCourseRegistrationView(viewsets.ViewSet):
             response_serializer = CourseRegistrationSerializer(registration)
             
             return RestResponse(data=response_serializer.data, status=status.HTTP_201_CREATED).response
+        except ClassRoomFullException as _:
+            return RestResponse(
+                status=status.HTTP_400_BAD_REQUEST,
+                message="Lớp đã đủ số lượng học sinh!"
+            ).response
         except Exception as e:
             logging.getLogger().exception("WebCourseRegistrationView.create exc=%s, req=%s", e, request.data)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -188,6 +242,11 @@ class WebCourseRegistrationView(viewsets.ViewSet):
             response_serializer = CourseRegistrationSerializer(updated_registration)
             
             return RestResponse(data=response_serializer.data, status=status.HTTP_200_OK).response
+        except ClassRoomFullException as _:
+            return RestResponse(
+                status=status.HTTP_400_BAD_REQUEST,
+                message="Lớp đã đủ số lượng học sinh!"
+            ).response
         except Exception as e:
             logging.getLogger().exception("WebCourseRegistrationView.update exc=%s, pk=%s, req=%s", e, pk, request.data)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
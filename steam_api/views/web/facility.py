@@ -7,6 +7,9 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import KeysetPaginator, keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.helpers.response_cache import cached_response
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.models.facility import Facility
 from steam_api.serializers.facility import (
@@ -58,22 +61,27 @@ class WebFacilityView(viewsets.ViewSet):
             ).response
 
     @swagger_auto_schema(
+        manual_parameters=[*PAGINATION_PARAMETERS, *SPARSE_FIELDS_PARAMETERS],
         operation_description="Get list of facilities",
         responses={
             200: FacilitySerializer(many=True),
             500: "Internal Server Error"
         }
     )
-    def list(self, request: Request) -> Response:
+    @cached_response("facilities")
+    @keyset_paginated(Facility, ordering=['-created_at'])
+    def list(self, request: Request, paginator: KeysetPaginator) -> Response:
         try:
             queryset = Facility.get_active_facilities().order_by('-created_at')
-            data = FacilitySerializer(queryset, many=True).data
+            queryset = paginator.paginate(queryset)
+
+            data = FacilitySerializer(queryset, many=True, context={'request': request}).data
 
             return RestResponse(
                 data=data,
-                status=status.HTTP_200_OK
+                status=status.HTTP_200_OK,
+                pagination=paginator.pagination
             ).response
-            
         except Exception as e:
             logger.exception("WebFacilityView.list exc=%s", e)
             return RestResponse(
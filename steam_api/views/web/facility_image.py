@@ -6,6 +6,8 @@ from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.models.facility_image import FacilityImage
 from steam_api.serializers.facility_image import (
@@ -85,6 +87,7 @@ class WebFacilityImageView(viewsets.ViewSet):
             ).response
 
     @swagger_auto_schema(
+        manual_parameters=SPARSE_FIELDS_PARAMETERS,
         operation_description="Get facility image details by ID",
         responses={
             200: FacilityImageSerializer,
@@ -94,8 +97,14 @@ class WebFacilityImageView(viewsets.ViewSet):
     )
     def retrieve(self, request: Request, pk: int) -> Response:
         try:
+            facility_images = FacilityImage.objects.filter(id=pk, deleted_at=None)
+
+            validators = ResponseValidators.for_queryset(request, facility_images)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
             try:
-                facility_image = FacilityImage.objects.get(id=pk, deleted_at=None)
+                facility_image = facility_images.get()
             except FacilityImage.DoesNotExist:
                 return RestResponse(
                     status=status.HTTP_404_NOT_FOUND,
@@ -103,8 +112,9 @@ class WebFacilityImageView(viewsets.ViewSet):
                 ).response
             
             return RestResponse(
-                data=FacilityImageSerializer(facility_image).data,
-                status=status.HTTP_200_OK
+                data=FacilityImageSerializer(facility_image, context={'request': request}).data,
+                status=status.HTTP_200_OK,
+                validators=validators
             ).response
             
         except Exception as e:
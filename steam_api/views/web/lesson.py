@@ -10,10 +10,13 @@ from django.db.models import Q
 from datetime import datetime, timedelta
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.models.lesson import Lesson
 from steam_api.models.lesson_replacement import LessonReplacement
+from steam_api.models.lesson_occurrence import LessonOccurrence
 from steam_api.models.web_user import WebUserRole
-from steam_api.serializers.lesson import LessonSerializer, UpdateLessonSerializer, CreateLessonSerializer
+from steam_api.serializers.lesson import LessonSerializer, UpdateLessonSerializer, CreateLessonSerializer, ReorderLessonsSerializer
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.serializers.lesson_replacement import CreateLessonReplacementSerializer, LessonReplacementSerializer
@@ -22,12 +25,14 @@ class WebLessonView(viewsets.ViewSet):
     authentication_classes = (WebUserAuthentication,)
 
     def get_permissions(self):
-        if self.action in ['create', 'update', 'destroy']:
+        if self.action in ['create', 'update', 'destroy', 'reorder']:
             return [IsManager()]
         return [IsNotRoot()]
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'module',
                 openapi.IN_QUERY,
@@ -71,7 +76,8 @@ class WebLessonView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Lesson, ordering=['module__sequence_number', 'sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebLessonView.list params=%s", request.query_params)
             module_id = request.query_params.get('module')
@@ -95,16 +101,10 @@ class WebLessonView(viewsets.ViewSet):
                     Q(module__class_room__teaching_assistant_id=teacher_id)
                 )
                 
-            lessons = lessons.order_by('module__sequence_number', 'sequence_number')
-            
             if date_str:
                 try:
                     target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    filtered_lessons = []
-                    for lesson in lessons:
-                        if lesson.start_datetime and lesson.start_datetime.date() == target_date:
-                            filtered_lessons.append(lesson)
-                    lessons = filtered_lessons
+                    lessons = lessons.filter(occurrence__lesson_date=target_date)
                 except ValueError:
                     return RestResponse(
                         data={"error": "Invalid date format. Use YYYY-MM-DD"},
@@ -112,14 +112,22 @@ class WebLessonView(viewsets.ViewSet):
                     ).response
             
             if status_filter:
-                filtered_lessons = []
-                for lesson in lessons:
-                    if lesson.status == status_filter:
-                        filtered_lessons.append(lesson)
-                lessons = filtered_lessons
+                lessons = lessons.filter(LessonOccurrence.status_q(
+                    status_filter,
+                    prefix='occurrence__',
+                    class_room_prefix='module__class_room__'
+                ))
                 
-            serializer = LessonSerializer(lessons, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            lessons = lessons.select_related(
+                'module',
+                'module__class_room',
+                'occurrence'
+            ).order_by('module__sequence_number', 'sequence_number')
+            
+            lessons = paginator.paginate(lessons)
+
+            serializer = LessonSerializer(lessons, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebLessonView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -256,19 +264,13 @@ class WebLessonView(viewsets.ViewSet):
                 return RestResponse(data={"error": "Lesson not found"}, status=status.HTTP_404_NOT_FOUND).response
             
             module = lesson.module
+            sequence_number = lesson.sequence_number
             
             lesson.deleted_at = timezone.now()
             lesson.save()
+            Lesson.park_deleted(Lesson.objects.filter(id=lesson.id))
             
-            lessons_to_update = Lesson.objects.filter(
-                module=module,
-                sequence_number__gt=lesson.sequence_number,
-                deleted_at__isnull=True
-            ).order_by('sequence_number')
-            
-            for lesson_to_update in lessons_to_update:
-                lesson_to_update.sequence_number -= 1
-                lesson_to_update.save()
+            Lesson.close_gap(module.id, sequence_number)
             
             module.total_lessons -= 1
             module.save(update_fields=['total_lessons'])
@@ -278,6 +280,63 @@ class WebLessonView(viewsets.ViewSet):
             logging.getLogger().exception("WebLessonView.destroy exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
         
+    @swagger_auto_schema(
+        operation_description="Reorder all lessons of a module at once. The lessons list must contain every lesson of the module in the new order.",
+        request_body=ReorderLessonsSerializer,
+        responses={
+            200: LessonSerializer(many=True),
+            400: openapi.Response(
+                description='Bad Request',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
+                )
+            ),
+            500: openapi.Response(
+                description='Internal Server Error',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
+                )
+            )
+        }
+    )
+    @action(detail=False, methods=['post'], url_path='reorder')
+    def reorder(self, request):
+        try:
+            logging.getLogger().info("WebLessonView.reorder req=%s", request.data)
+            
+            serializer = ReorderLessonsSerializer(data=request.data)
+            if not serializer.is_valid():
+                return RestResponse(data={"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST).response
+            
+            module = serializer.validated_data['module']
+            lesson_ids = serializer.validated_data['lessons']
+            
+            with transaction.atomic():
+                module_lesson_ids = set(
+                    Lesson.objects.select_for_update().filter(module=module, deleted_at__isnull=True).values_list('id', flat=True)
+                )
+                
+                if module_lesson_ids != set(lesson_ids):
+                    return RestResponse(
+                        status=status.HTTP_400_BAD_REQUEST,
+                        message="Danh sách bài học phải gồm tất cả bài học của học phần!"
+                    ).response
+                
+                Lesson.reorder(module.id, lesson_ids)
+                LessonOccurrence.rebuild_for_class_room(module.class_room)
+            
+            lessons = Lesson.objects.filter(module=module, deleted_at__isnull=True).order_by('sequence_number')
+            return RestResponse(data=LessonSerializer(lessons, many=True).data, status=status.HTTP_200_OK).response
+        except Exception as e:
+            logging.getLogger().exception("WebLessonView.reorder exc=%s", e)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
     @swagger_auto_schema(
         request_body=CreateLessonReplacementSerializer,
     )
@@ -7,6 +7,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsNotRoot, IsTeacher
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.models.lesson import Lesson
@@ -96,6 +98,8 @@ class WebLessonCheckinView(viewsets.ViewSet):
             
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'lesson',
                 openapi.IN_QUERY,
@@ -130,7 +134,8 @@ class WebLessonCheckinView(viewsets.ViewSet):
             500: 'Internal Server Error'
         }
     )
-    def list(self, request):
+    @keyset_paginated(LessonCheckin, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info(
                 "WebLessonCheckinView.list user=%s, params=%s",
@@ -174,12 +179,14 @@ class WebLessonCheckinView(viewsets.ViewSet):
                 'user'
             ).order_by('-created_at')
             
-            serializer = LessonCheckinSerializer(queryset, many=True)
+            queryset = paginator.paginate(queryset)
+
+            serializer = LessonCheckinSerializer(queryset, many=True, context={'request': request})
             return RestResponse(
                 data=serializer.data,
-                status=status.HTTP_200_OK
+                status=status.HTTP_200_OK,
+                pagination=paginator.pagination
             ).response
-            
         except Exception as e:
             logging.getLogger().exception("WebLessonCheckinView.list exc=%s", e)
             return RestResponse(
@@ -5,6 +5,9 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.conditional_get import ResponseValidators
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.models.lesson_documentation import LessonDocumentation
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.serializers.lesson_documentation import LessonDocumentationSerializer, CreateLessonDocumentationSerializer, UpdateLessonDocumentationSerializer
@@ -20,6 +23,8 @@ class WebLessonDocumentationView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'lesson',
                 openapi.IN_QUERY,
@@ -32,20 +37,24 @@ class WebLessonDocumentationView(viewsets.ViewSet):
             200: LessonDocumentationSerializer(many=True)
         }
     )
-    def list(self, request):
+    @keyset_paginated(LessonDocumentation, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebLessonDocumentationView.list req=%s", request.query_params)
             lesson_documentations = LessonDocumentation.objects.filter(deleted_at__isnull=True)
             lesson_param = request.query_params.get('lesson')
             if lesson_param:
                 lesson_documentations = lesson_documentations.filter(lesson=lesson_param)
-            serializer = LessonDocumentationSerializer(lesson_documentations, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            lesson_documentations = paginator.paginate(lesson_documentations)
+
+            serializer = LessonDocumentationSerializer(lesson_documentations, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebLessonDocumentationView.list exc=%s, req=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
     @swagger_auto_schema(
+        manual_parameters=SPARSE_FIELDS_PARAMETERS,
         responses={
             200: LessonDocumentationSerializer
         }
@@ -53,9 +62,15 @@ class WebLessonDocumentationView(viewsets.ViewSet):
     def retrieve(self, request, pk=None):
         try:
             logging.getLogger().info("WebLessonDocumentationView.retrieve pk=%s, req=%s", pk, request.query_params)
-            lesson_documentation = LessonDocumentation.objects.get(pk=pk, deleted_at__isnull=True)
-            serializer = LessonDocumentationSerializer(lesson_documentation)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            lesson_documentations = LessonDocumentation.objects.filter(pk=pk, deleted_at__isnull=True)
+
+            validators = ResponseValidators.for_queryset(request, lesson_documentations)
+            if validators.matches(request):
+                return RestResponse.not_modified(validators)
+
+            lesson_documentation = lesson_documentations.get()
+            serializer = LessonDocumentationSerializer(lesson_documentation, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, validators=validators).response
         except LessonDocumentation.DoesNotExist:
             return RestResponse(status=status.HTTP_404_NOT_FOUND).response
         except Exception as e:
@@ -1,59 +1,105 @@
 import logging
 from django.utils import timezone
 from rest_framework import viewsets, status
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.db import IntegrityError
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.renderers import FastJSONRenderer
+from steam_api.helpers.csv_export import stream_csv, student_columns, lesson_columns
+from steam_api.helpers.evaluation_analytics import GROUP_BY_FIELDS, summarize, summarize_by, trend
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
+from steam_api.const.score_criteria import SCORE_CRITERIA
 from steam_api.middlewares.permissions import IsTeacher, IsNotRoot
 from steam_api.models.lesson_evaluation import LessonEvaluation
 from steam_api.models.web_user import WebUserRole
 from steam_api.serializers.lesson_evaluation import (
     LessonEvaluationSerializer,
     CreateLessonEvaluationSerializer,
+    CreateBulkLessonEvaluationSerializer,
     UpdateLessonEvaluationSerializer
 )
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 
+EVALUATION_EXPORT_COLUMNS = [
+    ('id', 'id'),
+    *student_columns(),
+    *lesson_columns(),
+    *[(criteria['code'], criteria['code']) for criteria in SCORE_CRITERIA],
+    ('comment', 'comment'),
+    ('created_at', 'created_at'),
+]
+
+EVALUATION_FILTER_PARAMETERS = [
+    openapi.Parameter(
+        'lesson',
+        openapi.IN_QUERY,
+        description='Filter by lesson ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'module',
+        openapi.IN_QUERY,
+        description='Filter by module ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'class_room',
+        openapi.IN_QUERY,
+        description='Filter by class room ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'student',
+        openapi.IN_QUERY,
+        description='Filter by student ID',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    )
+]
+
+ANALYTICS_MAX_WINDOW = 20
+
+ANALYTICS_PARAMETERS = [
+    openapi.Parameter(
+        'group_by',
+        openapi.IN_QUERY,
+        description='Group the statistics by student, module or class_room (default student)',
+        type=openapi.TYPE_STRING,
+        enum=list(GROUP_BY_FIELDS),
+        required=False
+    ),
+    openapi.Parameter(
+        'window',
+        openapi.IN_QUERY,
+        description=f'Number of lessons of the moving average (1 to {ANALYTICS_MAX_WINDOW}, default 3)',
+        type=openapi.TYPE_INTEGER,
+        required=False
+    )
+]
+
 class WebLessonEvaluationView(viewsets.ViewSet):
     authentication_classes = (WebUserAuthentication,)
+    renderer_classes = (FastJSONRenderer, BrowsableAPIRenderer)
     
     def get_permissions(self):
-        if self.action in ['create', 'update', 'destroy']:
+        if self.action in ['create', 'bulk_create', 'update', 'destroy']:
             return [IsTeacher()]
         return [IsNotRoot()]
 
     @swagger_auto_schema(
         manual_parameters=[
-            openapi.Parameter(
-                'lesson',
-                openapi.IN_QUERY,
-                description='Filter by lesson ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'module',
-                openapi.IN_QUERY,
-                description='Filter by module ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'class_room',
-                openapi.IN_QUERY,
-                description='Filter by class room ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            ),
-            openapi.Parameter(
-                'student',
-                openapi.IN_QUERY,
-                description='Filter by student ID',
-                type=openapi.TYPE_INTEGER,
-                required=False
-            )
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
+            *EVALUATION_FILTER_PARAMETERS
         ],
         responses={
             200: LessonEvaluationSerializer(many=True),
@@ -68,42 +114,115 @@ class WebLessonEvaluationView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(LessonEvaluation, ordering=['lesson__module__sequence_number', 'lesson__sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebLessonEvaluationView.list params=%s", request.query_params)
-            lesson_id = request.query_params.get('lesson')
-            module_id = request.query_params.get('module')
-            class_room_id = request.query_params.get('class_room')
-            student_id = request.query_params.get('student')
+            evaluations = self.__filter_evaluations(request).order_by('lesson__module__sequence_number', 'lesson__sequence_number')
+                
+            evaluations = paginator.paginate(evaluations)
 
-            evaluations = LessonEvaluation.objects.filter(deleted_at__isnull=True)
+            serializer = LessonEvaluationSerializer(evaluations, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
+        except Exception as e:
+            logging.getLogger().exception("WebLessonEvaluationView.list exc=%s, params=%s", e, request.query_params)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
-            if request.user.role == WebUserRole.TEACHER:
-                evaluations = evaluations.filter(
-                    Q(lesson__module__class_room__teacher=request.user) |
-                    Q(lesson__module__class_room__teaching_assistant=request.user)
+    @swagger_auto_schema(
+        manual_parameters=EVALUATION_FILTER_PARAMETERS,
+        responses={
+            200: 'CSV file',
+            500: 'Internal Server Error'
+        }
+    )
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        try:
+            logging.getLogger().info("WebLessonEvaluationView.export params=%s", request.query_params)
+            return stream_csv("lesson_evaluations.csv", self.__filter_evaluations(request), EVALUATION_EXPORT_COLUMNS)
+        except Exception as e:
+            logging.getLogger().exception("WebLessonEvaluationView.export exc=%s, params=%s", e, request.query_params)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
+    @swagger_auto_schema(
+        operation_description="Per criterion average, min and max of the filtered evaluations, overall and per group, with the per lesson averages and their moving average over the last `window` lessons.",
+        manual_parameters=[
+            *EVALUATION_FILTER_PARAMETERS,
+            *ANALYTICS_PARAMETERS
+        ],
+        responses={
+            200: 'Summary, groups and trend of the score criteria',
+            400: 'Bad Request - Invalid group_by or window',
+            500: openapi.Response(
+                description='Internal Server Error',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
                 )
-            
-            if lesson_id:
-                evaluations = evaluations.filter(lesson_id=lesson_id)
-                
-            if module_id:
-                evaluations = evaluations.filter(lesson__module_id=module_id)
-                
-            if class_room_id:
-                evaluations = evaluations.filter(lesson__module__class_room_id=class_room_id)
-                
-            if student_id:
-                evaluations = evaluations.filter(student_id=student_id)
-                
-            evaluations = evaluations.order_by('lesson__module__sequence_number', 'lesson__sequence_number')
-                
-            serializer = LessonEvaluationSerializer(evaluations, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            )
+        }
+    )
+    @action(detail=False, methods=['get'], url_path='analytics')
+    def analytics(self, request):
+        try:
+            logging.getLogger().info("WebLessonEvaluationView.analytics params=%s", request.query_params)
+            group_by = request.query_params.get('group_by') or 'student'
+
+            if group_by not in GROUP_BY_FIELDS:
+                return RestResponse(message="Tiêu chí nhóm không hợp lệ!", status=status.HTTP_400_BAD_REQUEST).response
+
+            try:
+                window = int(request.query_params.get('window') or 3)
+            except ValueError:
+                window = 0
+
+            if not 1 <= window <= ANALYTICS_MAX_WINDOW:
+                return RestResponse(
+                    message=f"Số buổi học tính trung bình phải từ 1 đến {ANALYTICS_MAX_WINDOW}!",
+                    status=status.HTTP_400_BAD_REQUEST
+                ).response
+
+            evaluations = self.__filter_evaluations(request)
+
+            return RestResponse(data={
+                "summary": summarize(evaluations),
+                "groups": summarize_by(evaluations, group_by),
+                "trend": trend(evaluations, window),
+            }, status=status.HTTP_200_OK).response
         except Exception as e:
-            logging.getLogger().exception("WebLessonEvaluationView.list exc=%s, params=%s", e, request.query_params)
+            logging.getLogger().exception("WebLessonEvaluationView.analytics exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
+    def __filter_evaluations(self, request):
+        lesson_id = request.query_params.get('lesson')
+        module_id = request.query_params.get('module')
+        class_room_id = request.query_params.get('class_room')
+        student_id = request.query_params.get('student')
+
+        evaluations = LessonEvaluation.objects.filter(deleted_at__isnull=True)
+
+        if request.user.role == WebUserRole.TEACHER:
+            evaluations = evaluations.filter(
+                Q(lesson__module__class_room__teacher=request.user) |
+                Q(lesson__module__class_room__teaching_assistant=request.user)
+            )
+        
+        if lesson_id:
+            evaluations = evaluations.filter(lesson_id=lesson_id)
+            
+        if module_id:
+            evaluations = evaluations.filter(lesson__module_id=module_id)
+            
+        if class_room_id:
+            evaluations = evaluations.filter(lesson__module__class_room_id=class_room_id)
+            
+        if student_id:
+            evaluations = evaluations.filter(student_id=student_id)
+
+        return evaluations
+
     @swagger_auto_schema(
         request_body=CreateLessonEvaluationSerializer,
         responses={
@@ -135,7 +254,7 @@ class WebLessonEvaluationView(viewsets.ViewSet):
             lesson = data['lesson']
             student = data['student']
             
-            if student not in lesson.module.class_room.approved_students:
+            if not lesson.module.class_room.approved_students.filter(pk=student.pk).exists():
                 return RestResponse(
                     status=status.HTTP_400_BAD_REQUEST,
                     message="Học viên chưa tham gia lớp này!"
@@ -170,6 +289,82 @@ class WebLessonEvaluationView(viewsets.ViewSet):
             logging.getLogger().exception("WebLessonEvaluationView.create exc=%s, req=%s", e, request.data)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
+    @swagger_auto_schema(
+        operation_description="Evaluate several students of a lesson at once. Errors are reported per row and nothing is saved if any row is invalid.",
+        request_body=CreateBulkLessonEvaluationSerializer,
+        responses={
+            201: LessonEvaluationSerializer(many=True),
+            400: 'Bad Request - Invalid data, student not in class or evaluation already exists',
+            403: 'Forbidden - Not teacher of this class or lesson has not completed',
+            409: 'Conflict - An evaluation of one of the students was created meanwhile',
+            500: openapi.Response(
+                description='Internal Server Error',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
+                )
+            )
+        }
+    )
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        try:
+            logging.getLogger().info("WebLessonEvaluationView.bulk_create req=%s", request.data)
+            serializer = CreateBulkLessonEvaluationSerializer(data=request.data)
+            
+            if not serializer.is_valid():
+                return RestResponse(data=serializer.errors, status=status.HTTP_400_BAD_REQUEST).response
+            
+            lesson = serializer.validated_data['lesson']
+            class_room = lesson.module.class_room
+
+            if request.user not in [class_room.teacher, class_room.teaching_assistant]:
+                return RestResponse(
+                    status=status.HTTP_403_FORBIDDEN,
+                    message="Bạn không phải là giáo viên của lớp này!"
+                ).response
+                
+            if lesson.status != 'completed':
+                return RestResponse(
+                    status=status.HTTP_403_FORBIDDEN,
+                    message="Không thể đánh giá buổi học chưa hoàn thành!"
+                ).response
+
+            items = serializer.validated_data['evaluations']
+            approved_student_ids = set(class_room.approved_students.values_list('id', flat=True))
+            evaluated_student_ids = set(LessonEvaluation.objects.filter(
+                lesson=lesson,
+                student_id__in=[item['student'] for item in items],
+                deleted_at__isnull=True
+            ).values_list('student_id', flat=True))
+
+            errors = []
+            for item in items:
+                if item['student'] not in approved_student_ids:
+                    errors.append({"student": ["Học viên chưa tham gia lớp này!"]})
+                elif item['student'] in evaluated_student_ids:
+                    errors.append({"student": ["Đánh giá cho học viên này trong buổi học này đã tồn tại!"]})
+                else:
+                    errors.append({})
+
+            if any(errors):
+                return RestResponse(data={"evaluations": errors}, status=status.HTTP_400_BAD_REQUEST).response
+
+            evaluations = serializer.save()
+            response_serializer = LessonEvaluationSerializer(evaluations, many=True)
+            return RestResponse(data=response_serializer.data, status=status.HTTP_201_CREATED).response
+        except IntegrityError as e:
+            logging.getLogger().info("WebLessonEvaluationView.bulk_create conflict exc=%s", e)
+            return RestResponse(
+                status=status.HTTP_409_CONFLICT,
+                message="Đánh giá cho học viên trong buổi học này vừa được tạo bởi yêu cầu khác!"
+            ).response
+        except Exception as e:
+            logging.getLogger().exception("WebLessonEvaluationView.bulk_create exc=%s, req=%s", e, request.data)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
+
     @swagger_auto_schema(
         request_body=UpdateLessonEvaluationSerializer,
         responses={
@@ -1,18 +1,23 @@
 from datetime import timezone
 import logging
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db.models import Q
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsTeacher, IsNotRoot
 from steam_api.models.lesson_gallery import LessonGallery
 from steam_api.models.web_user import WebUserRole
 from steam_api.serializers.lesson_gallery import (
     LessonGallerySerializer,
-    CreateLessonGallerySerializer
+    CreateLessonGallerySerializer,
+    CreateLessonGalleryBatchSerializer
 )
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 
@@ -21,12 +26,14 @@ class WebLessonGalleryView(viewsets.ViewSet):
     parser_classes = (MultiPartParser, FormParser)
 
     def get_permissions(self):
-        if self.action in ['create']:
+        if self.action in ['create', 'batch_create']:
             return [IsTeacher()]
         return [IsNotRoot()]
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'lesson',
                 openapi.IN_QUERY,
@@ -62,7 +69,8 @@ class WebLessonGalleryView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(LessonGallery, ordering=['lesson__module__sequence_number', 'lesson__sequence_number'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebLessonGalleryView.list params=%s", request.query_params)
             lesson_id = request.query_params.get('lesson')
@@ -88,14 +96,16 @@ class WebLessonGalleryView(viewsets.ViewSet):
                 
             galleries = galleries.order_by('lesson__module__sequence_number', 'lesson__sequence_number')
                 
-            serializer = LessonGallerySerializer(galleries, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            galleries = paginator.paginate(galleries)
+
+            serializer = LessonGallerySerializer(galleries, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebLessonGalleryView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
     @swagger_auto_schema(
-        operation_description="Upload an image for a lesson. Maximum 5 images per lesson. Images will be stored in order of upload.",
+        operation_description=f"Upload an image for a lesson. Maximum {LessonGallery.MAX_IMAGES} images per lesson. Images will be stored in order of upload.",
         request_body=CreateLessonGallerySerializer,
         manual_parameters=[
             openapi.Parameter(
@@ -103,7 +113,7 @@ class WebLessonGalleryView(viewsets.ViewSet):
                 openapi.IN_FORM,
                 type=openapi.TYPE_FILE,
                 required=True,
-                description='Lesson image (max 5 images per lesson)'
+                description=f'Lesson image (max {LessonGallery.MAX_IMAGES} images per lesson)'
             )
         ],
         responses={
@@ -145,10 +155,10 @@ class WebLessonGalleryView(viewsets.ViewSet):
                 deleted_at__isnull=True
             ).first()
             
-            if gallery and gallery.images_count >= 5:
+            if gallery and gallery.images_count >= LessonGallery.MAX_IMAGES:
                 return RestResponse(
                     status=status.HTTP_400_BAD_REQUEST,
-                    message="Buổi học này đã có số lượng ảnh tối đa (5)!"
+                    message=f"Buổi học này đã có số lượng ảnh tối đa ({LessonGallery.MAX_IMAGES})!"
                 ).response 
 
             if 'image' not in request.FILES:
@@ -162,10 +172,73 @@ class WebLessonGalleryView(viewsets.ViewSet):
             
             response_serializer = LessonGallerySerializer(gallery)
             return RestResponse(data=response_serializer.data, status=status.HTTP_201_CREATED).response
+        except ValidationError as e:
+            return RestResponse(data=e.detail, status=status.HTTP_400_BAD_REQUEST).response
         except Exception as e:
             logging.getLogger().exception("WebLessonGalleryView.create exc=%s, req=%s", e, request.data)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
         
+    @swagger_auto_schema(
+        operation_description=f"Upload several images for a lesson at once. Maximum {LessonGallery.MAX_IMAGES} images per lesson. Images will be stored in the order they are sent.",
+        manual_parameters=[
+            openapi.Parameter(
+                'lesson',
+                openapi.IN_FORM,
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                description='Lesson ID'
+            ),
+            openapi.Parameter(
+                'images',
+                openapi.IN_FORM,
+                type=openapi.TYPE_ARRAY,
+                items=openapi.Items(type=openapi.TYPE_FILE),
+                collection_format='multi',
+                required=True,
+                description=f'Lesson images (max {LessonGallery.MAX_IMAGES} images per lesson)'
+            )
+        ],
+        responses={
+            201: LessonGallerySerializer(),
+            400: 'Bad Request - Invalid data or max images reached',
+            403: 'Forbidden - Not teacher of this class',
+            500: openapi.Response(
+                description='Internal Server Error',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'error': openapi.Schema(type=openapi.TYPE_STRING)
+                    }
+                )
+            )
+        }
+    )
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch_create(self, request):
+        try:
+            logging.getLogger().info("WebLessonGalleryView.batch_create req=%s", request.data)
+            serializer = CreateLessonGalleryBatchSerializer(data=request.data)
+            
+            if not serializer.is_valid():
+                return RestResponse(data=serializer.errors, status=status.HTTP_400_BAD_REQUEST).response
+
+            class_room = serializer.validated_data['lesson'].module.class_room
+            
+            if request.user not in [class_room.teacher, class_room.teaching_assistant]:
+                return RestResponse(
+                    status=status.HTTP_403_FORBIDDEN,
+                    message="Bạn không phải là giáo viên của lớp này!"
+                ).response
+
+            gallery = serializer.save()
+            
+            return RestResponse(data=LessonGallerySerializer(gallery).data, status=status.HTTP_201_CREATED).response
+        except ValidationError as e:
+            return RestResponse(data=e.detail, status=status.HTTP_400_BAD_REQUEST).response
+        except Exception as e:
+            logging.getLogger().exception("WebLessonGalleryView.batch_create exc=%s, req=%s", e, request.data)
+            return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 
+
     @swagger_auto_schema(
         operation_description="Delete a lesson gallery image",
         responses={
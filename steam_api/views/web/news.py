@@ -5,9 +5,11 @@ from steam_api.serializers.news import NewsSerializer, CreateNewsSerializer, Upd
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import KeysetPaginator, keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 import logging
-from steam_api.helpers.google_drive_storage import upload_image_to_drive
+from steam_api.helpers.upload_pipeline import stage_image, get_image_variants, schedule_drive_upload
 from datetime import datetime
 from rest_framework.request import Request
 
@@ -21,15 +23,19 @@ class WebNewsView(viewsets.ViewSet):
         return [IsNotRoot()]
 
     @swagger_auto_schema(
+        manual_parameters=[*PAGINATION_PARAMETERS, *SPARSE_FIELDS_PARAMETERS],
         operation_description="Get all news",
         responses={200: NewsSerializer(many=True)}
     )
-    def list(self, request: Request):
+    @keyset_paginated(News, ordering=['-posted_at'])
+    def list(self, request: Request, paginator: KeysetPaginator):
         try:
             logging.getLogger().info("WebNewsView.list params=%s", request.query_params)
             news = News.objects.filter(deleted_at__isnull=True).order_by('-posted_at')
-            serializer = NewsSerializer(news, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            news = paginator.paginate(news)
+
+            serializer = NewsSerializer(news, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebNewsView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
@@ -47,13 +53,15 @@ class WebNewsView(viewsets.ViewSet):
                 return RestResponse(data={"error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST).response
 
             image = serializer.validated_data.pop('image')
-            image_url = upload_image_to_drive(image)
+            staged = stage_image(image)
             news = News.objects.create(
                 title=serializer.validated_data['title'],
                 link=serializer.validated_data['link'],
-                image=image_url,
+                image=staged.url,
+                image_variants=get_image_variants(staged),
                 posted_at=serializer.validated_data['posted_at']
             )
+            schedule_drive_upload(staged, news, 'image')
             
             return RestResponse(data=NewsSerializer(news).data, status=status.HTTP_201_CREATED).response
         except Exception as e:
@@ -77,15 +85,21 @@ class WebNewsView(viewsets.ViewSet):
 
             validated_data = serializer.validated_data
 
+            staged = None
+
             if "image" in validated_data:
-                image_url = upload_image_to_drive(validated_data.pop('image'))
-                news.image = image_url
+                staged = stage_image(validated_data.pop('image'))
+                news.image = staged.url
+                news.image_variants = get_image_variants(staged)
 
             for key, value in validated_data.items():
                 setattr(news, key, value)
 
             news.save()
 
+            if staged:
+                schedule_drive_upload(staged, news, 'image')
+
             return RestResponse(data=NewsSerializer(news).data, status=status.HTTP_200_OK).response
         except News.DoesNotExist:
             return RestResponse(status=status.HTTP_404_NOT_FOUND).response
@@ -7,6 +7,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.permissions import IsManager, IsNotRoot
 from steam_api.models.student import Student
 from steam_api.models.web_user import WebUserRole
@@ -28,6 +30,8 @@ class WebStudentView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'search',
                 openapi.IN_QUERY,
@@ -49,7 +53,8 @@ class WebStudentView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(Student, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebStudentView.list params=%s", request.query_params)
             search = request.query_params.get('search', '')
@@ -72,13 +77,16 @@ class WebStudentView(viewsets.ViewSet):
                     Q(parent_phone__icontains=search)
                 )
                 
-            serializer = StudentSerializer(students, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            students = paginator.paginate(students)
+
+            serializer = StudentSerializer(students, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebStudentView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
 
     @swagger_auto_schema(
+        manual_parameters=SPARSE_FIELDS_PARAMETERS,
         responses={
             200: StudentSerializer(),
             404: 'Not Found',
@@ -104,7 +112,7 @@ class WebStudentView(viewsets.ViewSet):
             except Student.DoesNotExist:
                 return RestResponse(status=status.HTTP_404_NOT_FOUND).response
 
-            serializer = StudentSerializer(student)
+            serializer = StudentSerializer(student, context={'request': request})
             return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
         except Exception as e:
             logging.getLogger().exception("WebStudentView.retrieve exc=%s, pk=%s", e, pk)
@@ -5,6 +5,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.middlewares.permissions import IsManager
 from steam_api.models.student_registration import StudentRegistration, StudentRegistrationStatus
@@ -19,6 +21,8 @@ class WebStudentRegistrationView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'status',
                 openapi.IN_QUERY,
@@ -40,7 +44,8 @@ class WebStudentRegistrationView(viewsets.ViewSet):
             500: 'Internal Server Error'
         }
     )
-    def list(self, request):
+    @keyset_paginated(StudentRegistration, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebStudentRegistrationView.list params=%s", request.query_params)
             status_param = request.query_params.get('status')
@@ -60,8 +65,10 @@ class WebStudentRegistrationView(viewsets.ViewSet):
                 
             requests = requests.order_by('-created_at')
                 
-            serializer = StudentRegistrationSerializer(requests, many=True)
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            requests = paginator.paginate(requests)
+
+            serializer = StudentRegistrationSerializer(requests, many=True, context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebStudentRegistrationView.list exc=%s", e)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response
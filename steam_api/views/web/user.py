@@ -6,6 +6,8 @@ from drf_yasg import openapi
 from rest_framework.decorators import action
 
 from steam_api.helpers.response import RestResponse
+from steam_api.helpers.pagination import keyset_paginated, PAGINATION_PARAMETERS
+from steam_api.helpers.sparse_fields import SPARSE_FIELDS_PARAMETERS
 from steam_api.middlewares.web_authentication import WebUserAuthentication
 from steam_api.models.web_user import WebUser, WebUserRole, WebUserStatus
 from steam_api.serializers.web_user import (
@@ -19,6 +21,8 @@ class WebUserView(viewsets.ViewSet):
 
     @swagger_auto_schema(
         manual_parameters=[
+            *PAGINATION_PARAMETERS,
+            *SPARSE_FIELDS_PARAMETERS,
             openapi.Parameter(
                 'role',
                 openapi.IN_QUERY,
@@ -56,7 +60,8 @@ class WebUserView(viewsets.ViewSet):
             )
         }
     )
-    def list(self, request):
+    @keyset_paginated(WebUser, ordering=['-created_at'])
+    def list(self, request, paginator):
         try:
             logging.getLogger().info("WebUserView.list params=%s", request.query_params)
             role = request.query_params.get('role')
@@ -79,8 +84,10 @@ class WebUserView(viewsets.ViewSet):
                 
             users = users.order_by('-created_at')
                 
-            serializer = WebUserSerializer(users, many=True, exclude=['password'])
-            return RestResponse(data=serializer.data, status=status.HTTP_200_OK).response
+            users = paginator.paginate(users)
+
+            serializer = WebUserSerializer(users, many=True, exclude=['password'], context={'request': request})
+            return RestResponse(data=serializer.data, status=status.HTTP_200_OK, pagination=paginator.pagination).response
         except Exception as e:
             logging.getLogger().exception("WebUserView.list exc=%s, params=%s", e, request.query_params)
             return RestResponse(data={"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR).response 